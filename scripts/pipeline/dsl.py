@@ -14,7 +14,10 @@ from __future__ import annotations
 
 import math
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 # ---------------------------------------------------------------------------
 # Operations
@@ -42,6 +45,9 @@ _OPS: dict[str, Any] = {
 # Pattern to match: "operation(arg1, arg2, ...)"
 _STEP_RE = re.compile(r"^(\w+)\((.+)\)$")
 
+# Compiled step: (operation name, arguments, positions of #N references)
+CompiledStep = tuple[str, list[Any], list[int]]
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -60,11 +66,32 @@ def execute_program(program: list[str]) -> float | bool | str:
     Raises:
         DSLError: If a step cannot be parsed or executed.
     """
+    return execute_compiled(compile_program(program), program)
+
+
+def compile_program(program: list[str]) -> list[CompiledStep]:
+    """Parse a FinQA DSL program into executable steps.
+
+    Each step becomes ``(op_name, args, ref_positions)`` where literal
+    arguments are already converted to numbers/booleans and ``#N``
+    references are stored as the integer ``N`` at the positions listed
+    in ``ref_positions``. The result only contains JSON-compatible
+    values, so it can be cached on a question dict between stages.
+
+    Args:
+        program: List of DSL operation strings.
+
+    Returns:
+        One compiled step per program step.
+
+    Raises:
+        DSLError: If a step cannot be parsed.
+    """
     if not program:
         msg = "Empty program"
         raise DSLError(msg)
 
-    results: list[Any] = []
+    compiled: list[CompiledStep] = []
 
     for i, step in enumerate(program):
         step = step.strip()
@@ -80,15 +107,68 @@ def execute_program(program: list[str]) -> float | bool | str:
             msg = f"Step {i}: unknown operation '{op_name}'"
             raise DSLError(msg)
 
+        args: list[Any] = []
+        refs: list[int] = []
         try:
-            args = [_resolve_arg(a.strip(), results) for a in _split_args(args_str)]
+            for pos, a in enumerate(_split_args(args_str)):
+                a = a.strip()
+                if a.startswith("#"):
+                    args.append(_resolve_ref(a, i))
+                    refs.append(pos)
+                else:
+                    args.append(_parse_literal(a))
         except (ValueError, IndexError) as e:
             msg = f"Step {i}: argument error in '{step}': {e}"
             raise DSLError(msg) from e
 
+        compiled.append((op_name, args, refs))
+
+    return compiled
+
+
+def execute_compiled(
+    compiled: Sequence[Sequence[Any]], program: Sequence[str] | None = None
+) -> float | bool | str:
+    """Execute a program produced by :func:`compile_program`.
+
+    Accepts the compiled steps either as tuples or as the lists they
+    become after a JSON round-trip.
+
+    Args:
+        compiled: Compiled program steps.
+        program: The source program, quoted in error messages. Without
+            it the failing step is rendered back from its compiled form.
+
+    Returns:
+        The result of the last operation.
+
+    Raises:
+        DSLError: If a step cannot be executed.
+    """
+    if not compiled:
+        msg = "Empty program"
+        raise DSLError(msg)
+
+    results: list[Any] = []
+
+    for i, (op_name, args, refs) in enumerate(compiled):
+        op = _OPS.get(op_name)
+        if op is None:
+            msg = f"Step {i}: unknown operation '{op_name}'"
+            raise DSLError(msg)
+
+        call_args = list(args)
+        for pos in refs:
+            call_args[pos] = results[call_args[pos]]
+
         try:
-            result = _OPS[op_name](*args)
+            result = op(*call_args)
         except (TypeError, ZeroDivisionError, OverflowError) as e:
+            step = (
+                program[i].strip()
+                if program is not None
+                else _render_step(op_name, args, refs)
+            )
             msg = f"Step {i}: execution error in '{step}': {e}"
             raise DSLError(msg) from e
 
@@ -107,15 +187,23 @@ class DSLError(Exception):
 # ---------------------------------------------------------------------------
 
 
-def _resolve_arg(arg: str, results: list[Any]) -> Any:
-    """Resolve a DSL argument: #N reference or literal value."""
-    if arg.startswith("#"):
-        idx = int(arg[1:])
-        if idx < 0 or idx >= len(results):
-            msg = f"Invalid reference {arg} (only {len(results)} results available)"
-            raise IndexError(msg)
-        return results[idx]
+def _render_step(op_name: str, args: Sequence[Any], refs: Sequence[int]) -> str:
+    """Rebuild the source text of a compiled step for error messages."""
+    parts = [f"#{a}" if pos in refs else str(a) for pos, a in enumerate(args)]
+    return f"{op_name}({', '.join(parts)})"
+
+
+def _resolve_ref(arg: str, step_index: int) -> int:
+    """Resolve a ``#N`` reference to the index of an earlier step."""
+    idx = int(arg[1:])
+    if idx < 0 or idx >= step_index:
+        msg = f"Invalid reference {arg} (only {step_index} results available)"
+        raise IndexError(msg)
+    return idx
+
 
+def _parse_literal(arg: str) -> Any:
+    """Parse a literal DSL argument: boolean, number, or string."""
     # Boolean literals
     if arg.lower() == "true":
         return True
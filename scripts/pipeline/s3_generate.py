@@ -12,16 +12,21 @@ Usage::
 from __future__ import annotations
 
 import json
+import os
 import random
-from typing import TYPE_CHECKING, Any
-
-if TYPE_CHECKING:
-    from pathlib import Path
+import sys
+from pathlib import Path
+from typing import Any
 
 from loguru import logger
 
 from scripts.pipeline.config import CONTEXTS_DIR, GENERATED_DIR
-from scripts.pipeline.dsl import execute_program
+from scripts.pipeline.dsl import (
+    CompiledStep,
+    compile_program,
+    execute_compiled,
+    execute_program,
+)
 
 # Seed for reproducibility
 random.seed(42)
@@ -98,7 +103,8 @@ def _generate_from_pl_comparison(
                 f"divide(#0, {prev_val})",
                 "multiply(#1, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}%"
             questions.append(
                 _make_question(
@@ -110,6 +116,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{revenue_key}_{year_curr}",
                         f"{revenue_key}_{year_prev}",
@@ -126,7 +133,8 @@ def _generate_from_pl_comparison(
                 f"divide({op}, {rev})",
                 "multiply(#0, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}%"
             questions.append(
                 _make_question(
@@ -137,6 +145,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{op_income_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -153,7 +162,8 @@ def _generate_from_pl_comparison(
             f"subtract({curr_val}, {prev_val})",
             "abs(#0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         assert isinstance(result, (int, float))
         direction = "増加" if diff > 0 else "減少"
         answer = f"{result:,.0f}{scale}"
@@ -167,6 +177,7 @@ def _generate_from_pl_comparison(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"{revenue_key}_{year_curr}",
                     f"{revenue_key}_{year_prev}",
@@ -183,7 +194,8 @@ def _generate_from_pl_comparison(
                 f"divide({gross}, {rev})",
                 "multiply(#0, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}%"
             questions.append(
                 _make_question(
@@ -194,6 +206,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{gross_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -211,7 +224,8 @@ def _generate_from_pl_comparison(
                 f"divide(#0, {prev_val})",
                 "multiply(#1, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}%"
             questions.append(
                 _make_question(
@@ -223,6 +237,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{op_income_key}_{year_curr}",
                         f"{op_income_key}_{year_prev}",
@@ -239,7 +254,8 @@ def _generate_from_pl_comparison(
                 f"divide({sga}, {rev})",
                 "multiply(#0, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}%"
             questions.append(
                 _make_question(
@@ -250,6 +266,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{sga_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -271,7 +288,8 @@ def _generate_from_pl_comparison(
                 "multiply(#2, 100)",
                 "subtract(#1, #3)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}ポイント"
             questions.append(
                 _make_question(
@@ -283,6 +301,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{ordinary_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -300,7 +319,8 @@ def _generate_from_pl_comparison(
             f"subtract({curr_val}, {prev_val})",
             "greater(#0, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "増収" if result else "減収"
         questions.append(
             _make_question(
@@ -312,6 +332,7 @@ def _generate_from_pl_comparison(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"{revenue_key}_{year_curr}",
                     f"{revenue_key}_{year_prev}",
@@ -327,7 +348,8 @@ def _generate_from_pl_comparison(
             f"subtract({curr_val}, {prev_val})",
             "greater(#0, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "増益" if result else "減益"
         questions.append(
             _make_question(
@@ -339,6 +361,7 @@ def _generate_from_pl_comparison(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"{op_income_key}_{year_curr}",
                     f"{op_income_key}_{year_prev}",
@@ -359,7 +382,8 @@ def _generate_from_pl_comparison(
                 "subtract(#0, #1)",
                 "greater(#2, 0)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = "改善" if result else "悪化"
             questions.append(
                 _make_question(
@@ -371,6 +395,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{op_income_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -388,7 +413,8 @@ def _generate_from_pl_comparison(
             f"subtract({curr_val}, {prev_val})",
             "greater(#0, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "増益" if result else "減益"
         questions.append(
             _make_question(
@@ -400,6 +426,7 @@ def _generate_from_pl_comparison(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"{ordinary_key}_{year_curr}",
                     f"{ordinary_key}_{year_prev}",
@@ -416,7 +443,8 @@ def _generate_from_pl_comparison(
                 f"divide({ni}, {rev})",
                 "multiply(#0, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}%"
             questions.append(
                 _make_question(
@@ -427,6 +455,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{net_income_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -443,7 +472,8 @@ def _generate_from_pl_comparison(
                 f"divide({cogs}, {rev})",
                 "multiply(#0, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.1f}%"
             questions.append(
                 _make_question(
@@ -454,6 +484,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{cogs_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -527,7 +558,8 @@ def _generate_from_pl_comparison(
                 "subtract(#0, #1)",
                 "greater(#2, 0)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = "改善" if result else "悪化"
             questions.append(
                 _make_question(
@@ -539,6 +571,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{gross_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -557,7 +590,8 @@ def _generate_from_pl_comparison(
                 f"subtract({curr_val}, {prev_val})",
                 "greater(#0, 0)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = "増益" if result else "減益"
             questions.append(
                 _make_question(
@@ -569,6 +603,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{net_income_key}_{year_curr}",
                         f"{net_income_key}_{year_prev}",
@@ -589,7 +624,8 @@ def _generate_from_pl_comparison(
                 "subtract(#0, #1)",
                 "greater(#2, 0)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = "改善" if result else "悪化"
             questions.append(
                 _make_question(
@@ -601,6 +637,7 @@ def _generate_from_pl_comparison(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[
                         f"{ordinary_key}_{year_curr}",
                         f"{revenue_key}_{year_curr}",
@@ -660,7 +697,8 @@ def _generate_from_bs_summary(
             f"divide({current_assets}, {current_liab})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.1f}%"
         questions.append(
             _make_question(
@@ -671,6 +709,7 @@ def _generate_from_bs_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=["流動資産", "流動負債"],
             )
         )
@@ -685,7 +724,8 @@ def _generate_from_bs_summary(
             f"divide({equity}, {total_assets})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.1f}%"
         questions.append(
             _make_question(
@@ -696,6 +736,7 @@ def _generate_from_bs_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=evidence,
             )
         )
@@ -711,7 +752,8 @@ def _generate_from_bs_summary(
             f"divide({total_liabilities}, {total_assets})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.1f}%"
         questions.append(
             _make_question(
@@ -723,6 +765,7 @@ def _generate_from_bs_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=["負債合計", "流動資産", "固定資産"],
             )
         )
@@ -736,7 +779,8 @@ def _generate_from_bs_summary(
             f"divide({fixed_assets}, {total_assets})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.1f}%"
         questions.append(
             _make_question(
@@ -748,6 +792,7 @@ def _generate_from_bs_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=evidence,
             )
         )
@@ -758,7 +803,8 @@ def _generate_from_bs_summary(
             f"subtract({total_assets}, {total_assets_prev})",
             "greater(#0, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "増加" if result else "減少"
         questions.append(
             _make_question(
@@ -770,6 +816,7 @@ def _generate_from_bs_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"資産合計_{year}",
                     f"資産合計_{year_prev}",
@@ -792,7 +839,8 @@ def _generate_from_bs_summary(
             "subtract(#0, #1)",
             "greater(#2, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "改善" if result else "悪化"
         eq_label = (
             "純資産合計" if f"純資産合計{y}" in rv else "株主資本合計"
@@ -807,6 +855,7 @@ def _generate_from_bs_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"{eq_label}_{year}",
                     f"資産合計_{year}",
@@ -844,7 +893,8 @@ def _generate_from_bs_consistency(
             f"add(#1, {equity})",
             "eq(#0, #2)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         fa_label = (
             "固定資産" if f"固定資産{y}" in rv else "非流動資産"
         )
@@ -863,6 +913,7 @@ def _generate_from_bs_consistency(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     "流動資産", fa_label, "流動負債",
                     "固定負債" if fixed_liab else "", eq_label,
@@ -932,7 +983,8 @@ def _generate_from_bs_consistency(
                 f"divide({equity}, #0)",
                 "multiply(#1, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             eq_label = (
                 "純資産合計"
                 if f"純資産合計{y}" in rv
@@ -949,6 +1001,7 @@ def _generate_from_bs_consistency(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=["流動資産", "固定資産", eq_label],
                 )
             )
@@ -979,7 +1032,8 @@ def _generate_from_cf_summary(
         program = [
             f"add({ope_cf}, {inv_cf})",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:,.0f}{scale}"
         questions.append(
             _make_question(
@@ -991,6 +1045,7 @@ def _generate_from_cf_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"営業活動によるキャッシュ・フロー_{year_curr}",
                     f"投資活動によるキャッシュ・フロー_{year_curr}",
@@ -1004,7 +1059,8 @@ def _generate_from_cf_summary(
             f"add({ope_cf}, {inv_cf})",
             f"add(#0, {fin_cf})",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:,.0f}{scale}"
         questions.append(
             _make_question(
@@ -1017,6 +1073,7 @@ def _generate_from_cf_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"営業活動によるキャッシュ・フロー_{year_curr}",
                     f"投資活動によるキャッシュ・フロー_{year_curr}",
@@ -1031,7 +1088,8 @@ def _generate_from_cf_summary(
             f"divide({ope_cf}, {abs(inv_cf)})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.1f}%"
         questions.append(
             _make_question(
@@ -1043,6 +1101,7 @@ def _generate_from_cf_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"営業活動によるキャッシュ・フロー_{year_curr}",
                     f"投資活動によるキャッシュ・フロー_{year_curr}",
@@ -1062,7 +1121,8 @@ def _generate_from_cf_summary(
             f"subtract({ope_cf}, {ope_prev})",
             "greater(#0, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "増加" if result else "減少"
         questions.append(
             _make_question(
@@ -1075,6 +1135,7 @@ def _generate_from_cf_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"営業活動によるキャッシュ・フロー_{year_curr}",
                     f"営業活動によるキャッシュ・フロー_{year_prev}",
@@ -1095,7 +1156,8 @@ def _generate_from_cf_summary(
             "subtract(#0, #1)",
             "greater(#2, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "改善" if result else "悪化"
         questions.append(
             _make_question(
@@ -1108,6 +1170,7 @@ def _generate_from_cf_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"営業活動によるキャッシュ・フロー_{year_curr}",
                     f"投資活動によるキャッシュ・フロー_{year_curr}",
@@ -1123,7 +1186,8 @@ def _generate_from_cf_summary(
             f"subtract({inv_cf}, {inv_prev})",
             "greater(#0, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "増加" if result else "減少"
         questions.append(
             _make_question(
@@ -1136,6 +1200,7 @@ def _generate_from_cf_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"投資活動によるキャッシュ・フロー_{year_curr}",
                     f"投資活動によるキャッシュ・フロー_{year_prev}",
@@ -1151,7 +1216,8 @@ def _generate_from_cf_summary(
             f"subtract({fin_cf}, {fin_prev})",
             "greater(#0, 0)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = "増加" if result else "減少"
         questions.append(
             _make_question(
@@ -1164,6 +1230,7 @@ def _generate_from_cf_summary(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[
                     f"財務活動によるキャッシュ・フロー_{year_curr}",
                     f"財務活動によるキャッシュ・フロー_{year_prev}",
@@ -1214,7 +1281,8 @@ def _generate_from_cross_statement(
             f"divide({ordinary}, {total_assets})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.2f}%"
         questions.append(
             _make_question(
@@ -1226,6 +1294,7 @@ def _generate_from_cross_statement(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=["経常利益", "資産合計"],
             )
         )
@@ -1241,7 +1310,8 @@ def _generate_from_cross_statement(
             f"divide({net_income}, {equity})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.2f}%"
         questions.append(
             _make_question(
@@ -1253,6 +1323,7 @@ def _generate_from_cross_statement(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[ni_label, "純資産合計"],
             )
         )
@@ -1263,7 +1334,8 @@ def _generate_from_cross_statement(
             f"divide({op_income}, {revenue[1]})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.1f}%"
         questions.append(
             _make_question(
@@ -1275,6 +1347,7 @@ def _generate_from_cross_statement(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=["営業利益", revenue[0]],
             )
         )
@@ -1285,7 +1358,8 @@ def _generate_from_cross_statement(
             f"divide({revenue[1]}, {total_assets})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.1f}%"
         questions.append(
             _make_question(
@@ -1297,6 +1371,7 @@ def _generate_from_cross_statement(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=[revenue[0], "資産合計"],
             )
         )
@@ -1338,7 +1413,8 @@ def _generate_from_cross_statement(
             f"divide({ordinary}, {total_assets})",
             "multiply(#0, 100)",
         ]
-        result = execute_program(program)
+        compiled = compile_program(program)
+        result = execute_compiled(compiled, program)
         answer = f"{result:.2f}%"
         questions.append(
             _make_question(
@@ -1350,6 +1426,7 @@ def _generate_from_cross_statement(
                 ),
                 answer=answer,
                 program=program,
+                compiled=compiled,
                 gold_evidence=["経常利益", "資産合計"],
             )
         )
@@ -1377,7 +1454,8 @@ def _generate_from_cross_statement(
                 "multiply(#3, #2)",                        # #4: ROE (decimal)
                 "multiply(#4, 100)",                       # #5: ROE (%)
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.2f}%"
             questions.append(
                 _make_question(
@@ -1390,6 +1468,7 @@ def _generate_from_cross_statement(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[ni_label, rev_label, "資産合計", eq_label],
                 )
             )
@@ -1399,7 +1478,8 @@ def _generate_from_cross_statement(
                 f"divide({net_income}, {rev_val})",
                 "multiply(#0, 100)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.2f}%"
             questions.append(
                 _make_question(
@@ -1410,6 +1490,7 @@ def _generate_from_cross_statement(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[ni_label, rev_label],
                 )
             )
@@ -1419,7 +1500,8 @@ def _generate_from_cross_statement(
                 f"divide({rev_val}, {total_assets})",
                 "round(#0, 2)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.2f}倍"
             questions.append(
                 _make_question(
@@ -1431,6 +1513,7 @@ def _generate_from_cross_statement(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=[rev_label, "資産合計"],
                 )
             )
@@ -1440,7 +1523,8 @@ def _generate_from_cross_statement(
                 f"divide({total_assets}, {equity})",
                 "round(#0, 2)",
             ]
-            result = execute_program(program)
+            compiled = compile_program(program)
+            result = execute_compiled(compiled, program)
             answer = f"{result:.2f}倍"
             questions.append(
                 _make_question(
@@ -1452,6 +1536,7 @@ def _generate_from_cross_statement(
                     ),
                     answer=answer,
                     program=program,
+                    compiled=compiled,
                     gold_evidence=["資産合計", eq_label],
                 )
             )
@@ -1496,26 +1581,38 @@ def _make_question(
     answer: str,
     program: list[str],
     gold_evidence: list[str],
+    compiled: list[CompiledStep] | None = None,
 ) -> dict[str, Any]:
-    """Create a QA pair dict."""
+    """Create a QA pair dict.
+
+    When the generator already compiled the program to compute the
+    answer, the steps are cached under ``qa["_compiled"]`` together with
+    the source program, so Stage 4 can verify the answer without
+    re-parsing as long as the program is unchanged. Small-vocabulary
+    metadata values are interned so the many questions generated from
+    one context share a single string object per value.
+    """
     table = ctx["table"]
     evidence_indices = _labels_to_row_indices(table, gold_evidence)
+    qa: dict[str, Any] = {
+        "question": question,
+        "answer": answer,
+        "program": program,
+        "gold_evidence": evidence_indices,
+    }
+    if compiled is not None:
+        qa["_compiled"] = {"program": program, "steps": compiled}
     return {
-        "company_name": ctx["company_name"],
-        "edinet_code": ctx["edinet_code"],
-        "source_doc_id": ctx.get("source_doc_id", ""),
-        "filing_year": ctx["filing_year"],
-        "accounting_standard": ctx["accounting_standard"],
-        "subtask": subtask,
+        "company_name": sys.intern(ctx["company_name"]),
+        "edinet_code": sys.intern(ctx["edinet_code"]),
+        "source_doc_id": sys.intern(ctx.get("source_doc_id", "")),
+        "filing_year": sys.intern(ctx["filing_year"]),
+        "accounting_standard": sys.intern(ctx["accounting_standard"]),
+        "subtask": sys.intern(subtask),
         "pre_text": ctx["pre_text"],
         "post_text": ctx["post_text"],
         "table": table,
-        "qa": {
-            "question": question,
-            "answer": answer,
-            "program": program,
-            "gold_evidence": evidence_indices,
-        },
+        "qa": qa,
         "scale": ctx.get("scale", ""),
     }
 
@@ -1540,8 +1637,6 @@ _GENERATORS = {
 
 def run(output_dir: Path | None = None) -> None:
     """Run Stage 3: generate QA pairs from contexts."""
-    import os
-
     ctx_dir = CONTEXTS_DIR
     out_dir = output_dir or GENERATED_DIR
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -1553,16 +1648,14 @@ def run(output_dir: Path | None = None) -> None:
         "temporal_reasoning": 0,
     }
 
-    ctx_files = sorted(
-        f
-        for f in os.listdir(ctx_dir)
-        if f.endswith("_contexts.json")
-    )
-
-    for ctx_file in ctx_files:
-        contexts = json.loads(
-            (ctx_dir / ctx_file).read_text(encoding="utf-8")
+    with os.scandir(ctx_dir) as entries:
+        ctx_paths = sorted(
+            (Path(e.path) for e in entries if e.name.endswith("_contexts.json")),
+            key=lambda p: p.name,
         )
+
+    for ctx_path in ctx_paths:
+        contexts = json.loads(ctx_path.read_text(encoding="utf-8"))
         for ctx in contexts:
             ct = ctx.get("context_type", "")
             generator = _GENERATORS.get(ct)
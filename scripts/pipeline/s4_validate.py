@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import math
+import operator
 from collections import Counter, defaultdict
 from typing import TYPE_CHECKING, Any
 
@@ -29,7 +30,7 @@ from scripts.pipeline.config import (
     MIN_PROGRAM_STEPS,
     SUBTASK_TARGETS,
 )
-from scripts.pipeline.dsl import DSLError, execute_program
+from scripts.pipeline.dsl import DSLError, execute_compiled, execute_program
 
 # ---------------------------------------------------------------------------
 # Answer matching (mirrors jfinqa._metrics logic)
@@ -135,6 +136,23 @@ def _deduplicate(
 # Validation checks
 # ---------------------------------------------------------------------------
 
+# Fetches (question, answer, program) in one call; raises KeyError on the
+# first missing field.
+_REQUIRED_QA_FIELDS = operator.itemgetter("question", "answer", "program")
+
+
+def _cached_steps(qa: dict[str, Any], program: list[str]) -> list[Any] | None:
+    """Return the Stage 3 compiled steps if they belong to *program*.
+
+    The cache records the program it was compiled from; if the program
+    has been edited since, the stale steps are ignored.
+    """
+    cache = qa.get("_compiled")
+    if not isinstance(cache, dict) or cache.get("program") != program:
+        return None
+    steps: list[Any] = cache["steps"]
+    return steps
+
 
 def validate_question(q: dict[str, Any]) -> tuple[bool, str]:
     """Run all validation checks on a single QA pair.
@@ -144,16 +162,16 @@ def validate_question(q: dict[str, Any]) -> tuple[bool, str]:
     qa = q.get("qa", {})
 
     # 1. Schema check
-    for field in ("question", "answer", "program"):
-        if field not in qa:
-            return False, f"missing_field:{field}"
+    try:
+        question, answer, program = _REQUIRED_QA_FIELDS(qa)
+    except KeyError as e:
+        return False, f"missing_field:{e.args[0]}"
 
-    if not qa["question"].strip():
+    if not (question and question.strip()):
         return False, "empty_question"
-    if not qa["answer"].strip():
+    if not (answer and answer.strip()):
         return False, "empty_answer"
 
-    program = qa["program"]
     if not isinstance(program, list):
         return False, "program_not_list"
 
@@ -161,14 +179,17 @@ def validate_question(q: dict[str, Any]) -> tuple[bool, str]:
     if len(program) < MIN_PROGRAM_STEPS:
         return False, f"too_few_steps:{len(program)}"
 
-    # 3. Execute program
+    # 3. Execute program (reuse the Stage 3 parse when available)
+    compiled = _cached_steps(qa, program)
     try:
-        result = execute_program(program)
+        if compiled is not None:
+            result = execute_compiled(compiled, program)
+        else:
+            result = execute_program(program)
     except DSLError as e:
         return False, f"dsl_error:{e}"
 
     # 4. Format result for comparison
-    answer = qa["answer"]
     if isinstance(result, bool):
         result_str = "true" if result else "false"
         # Map Japanese boolean answers to true/false
@@ -304,6 +325,9 @@ def run(generated_dir: Path | None = None, output_dir: Path | None = None) -> No
         for q in questions:
             total_loaded += 1
             passed, reason = validate_question(q)
+            # The Stage 3 compiled-program cache is only needed for
+            # validation; keep it out of every output file.
+            q.get("qa", {}).pop("_compiled", None)
             subtask = q.get("subtask", "numerical_reasoning")
 
             if passed:
@@ -391,22 +415,19 @@ def _compute_stats(
     final: list[dict[str, Any]],
     rejected: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    """Compute dataset statistics."""
-    subtask_counts: Counter[str] = Counter()
-    company_counts: Counter[str] = Counter()
-    gaap_counts: Counter[str] = Counter()
-    program_lengths: list[int] = []
+    """Compute dataset statistics.
 
-    for q in final:
-        subtask_counts[q.get("subtask", "unknown")] += 1
-        company_counts[q.get("edinet_code", "unknown")] += 1
-        gaap_counts[q.get("accounting_standard", "unknown")] += 1
-        program_lengths.append(len(q.get("qa", {}).get("program", [])))
+    Counts are built by feeding generators to ``Counter``, which tallies
+    in C rather than through per-item ``+= 1`` updates.
+    """
+    subtask_counts = Counter(q.get("subtask", "unknown") for q in final)
+    company_counts = Counter(q.get("edinet_code", "unknown") for q in final)
+    gaap_counts = Counter(q.get("accounting_standard", "unknown") for q in final)
+    total_steps = sum(len(q.get("qa", {}).get("program", [])) for q in final)
 
-    rejection_reasons: Counter[str] = Counter()
-    for r in rejected:
-        reason = r.get("reason", "unknown")
-        rejection_reasons[reason.split(":")[0]] += 1
+    rejection_reasons = Counter(
+        r.get("reason", "unknown").partition(":")[0] for r in rejected
+    )
 
     return {
         "total_questions": len(final),
@@ -414,7 +435,7 @@ def _compute_stats(
         "by_subtask": dict(subtask_counts),
         "unique_companies": len(company_counts),
         "by_accounting_standard": dict(gaap_counts),
-        "avg_program_steps": sum(program_lengths) / max(1, len(program_lengths)),
+        "avg_program_steps": total_steps / max(1, len(final)),
         "rejection_reasons": dict(rejection_reasons),
     }
 
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import json
 import math
 
 import pytest
 
-from scripts.pipeline.dsl import DSLError, execute_program
+from scripts.pipeline.dsl import (
+    DSLError,
+    compile_program,
+    execute_compiled,
+    execute_program,
+)
 
 
 class TestBasicOperations:
@@ -126,3 +132,31 @@ class TestRealWorldExamples:
     def test_fcf_calculation(self) -> None:
         result = execute_program(["add(25000, -15000)"])
         assert result == 10000
+
+
+class TestCompiledProgram:
+    def test_matches_execute_program(self) -> None:
+        program = [
+            "subtract(1500000, 1200000)",
+            "divide(#0, 1200000)",
+            "multiply(#1, 100)",
+        ]
+        compiled = compile_program(program)
+        assert execute_compiled(compiled) == execute_program(program)
+
+    def test_json_roundtrip(self) -> None:
+        compiled = compile_program(["add(50000, 80000)", "eq(#0, 130000)"])
+        restored = json.loads(json.dumps(compiled))
+        assert execute_compiled(restored) is True
+
+    def test_execution_error_quotes_step(self) -> None:
+        program = ["add(1.5, 0)", "exp(#0, 100000)"]
+        compiled = compile_program(program)
+        with pytest.raises(DSLError, match=r"in 'exp\(#0, 100000\)'"):
+            execute_compiled(compiled, program)
+        with pytest.raises(DSLError, match=r"in 'exp\(#0, 100000\)'"):
+            execute_compiled(compiled)
+
+    def test_bad_reference_at_compile_time(self) -> None:
+        with pytest.raises(DSLError, match="argument error"):
+            compile_program(["add(1, 2)", "add(#1, 10)"])
@@ -0,0 +1,51 @@
+"""Tests for Stage 4 question validation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from scripts.pipeline import s4_validate
+from scripts.pipeline.dsl import compile_program
+from scripts.pipeline.s4_validate import validate_question
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def _question(program: list[str], answer: str) -> dict[str, Any]:
+    return {
+        "subtask": "numerical_reasoning",
+        "qa": {
+            "question": "売上高の合計はいくらか。",
+            "answer": answer,
+            "program": program,
+            "gold_evidence": [0, 1],
+        },
+    }
+
+
+def _with_cache(q: dict[str, Any], program: list[str]) -> dict[str, Any]:
+    q["qa"]["_compiled"] = {"program": program, "steps": compile_program(program)}
+    return q
+
+
+class TestCompiledCache:
+    def test_uses_cached_steps(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        program = ["add(1000, 2000)"]
+        q = _with_cache(_question(program, "3000"), program)
+
+        def fail(program: list[str]) -> None:
+            raise AssertionError("program was re-parsed")
+
+        monkeypatch.setattr(s4_validate, "execute_program", fail)
+        assert validate_question(q) == (True, "")
+
+    def test_stale_cache_ignored(self) -> None:
+        # The cache still matches the old answer, but the program was edited
+        q = _with_cache(_question(["add(1000, 5000)"], "3000"), ["add(1000, 2000)"])
+        passed, reason = validate_question(q)
+        assert not passed
+        assert reason.startswith("answer_mismatch:program=6000")
+
+    def test_without_cache(self) -> None:
+        assert validate_question(_question(["add(1000, 2000)"], "3000")) == (True, "")
@@ -14,6 +14,26 @@ Captured per question: raw response, extracted answer, correctness,
 input/output/thinking token counts, truncation flag, parse success,
 latency, cost (using the configured pricing table).
 
+Requests are issued concurrently through the providers' async clients,
+with at most ``--concurrency`` calls in flight at once. Calls are
+throttled up front by request-per-minute and token-per-minute buckets
+(``--rpm`` / ``--tpm``); a 429 response waits for ``Retry-After`` and is
+retried. Greedy-decoded responses are cached on disk under
+``scripts/data/cache/`` so re-runs skip questions already answered.
+Attempts served from the cache are marked ``cached`` and left out of the
+cost and latency figures, which only count calls actually made.
+
+Predictions are appended to ``<model>__<regime>__predictions.jsonl``, one
+attempt per line, and a re-run resumes from that file. Runs saved in the
+older single-dict ``__predictions.json`` format are converted to JSONL
+the first time they are resumed; the ``.json`` file is left in place.
+
+With ``--batch-api`` (OpenAI and Anthropic only) the unanswered questions
+are instead submitted as one Batch API job at half price and polled until
+the job ends. The job id is kept in ``<model>__<regime>__batch.json`` until
+its results are saved, so an interrupted run resumes polling the same job
+instead of submitting (and paying for) a new one.
+
 Usage::
 
     source ~/.tokens
@@ -24,23 +44,56 @@ Usage::
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import json
 import os
 import re
 import sys
 import time
-from dataclasses import asdict, dataclass, field
+from collections import Counter
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from statistics import median, quantiles
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT / "src"))
 
 load_dotenv(ROOT / ".env")
 
+CACHE_DIR = ROOT / "scripts" / "data" / "cache"
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize *obj* for the predictions file and response cache.
+
+    Uses ``orjson`` when installed; both paths emit UTF-8 text without
+    ASCII escaping, so files written by either are interchangeable.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _loads(data: str) -> Any:
+    """Parse JSON text; raises ``json.JSONDecodeError`` on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 SYSTEM_PROMPT = (
     "あなたは日本の企業の財務諸表を分析する金融アナリストです。"
     "与えられた財務データを読み、質問に正確に答えてください。"
@@ -50,14 +103,24 @@ SYSTEM_PROMPT = (
 )
 
 
-def _build_prompt(question: str, context: str) -> str:
+# The prompt is split so the question-independent part (instructions and
+# context) forms a stable prefix that provider prompt caches can reuse
+# across questions that share a context.
+def _prompt_prefix(context: str) -> str:
+    return f"以下の財務データを読み、質問に答えてください。\n\n{context}\n\n"
+
+
+def _prompt_suffix(question: str) -> str:
     return (
-        f"以下の財務データを読み、質問に答えてください。\n\n{context}\n\n"
         f"質問: {question}\n\n"
         f"計算過程を示した後、最終行に「Answer: 値」の形式で答えを出力してください。"
     )
 
 
+def _build_prompt(question: str, context: str) -> str:
+    return _prompt_prefix(context) + _prompt_suffix(question)
+
+
 def _extract_answer(response: str) -> tuple[str, bool]:
     """Return (predicted_answer, parse_success)."""
     if not response:
@@ -125,6 +188,8 @@ class Attempt:
     latency_s: float
     cost_usd: float
     error: str | None = None
+    # Served from the response cache; cost/latency are from the original call
+    cached: bool = False
 
 
 @dataclass
@@ -159,12 +224,43 @@ REGIMES: dict[str, RegimeConfig] = {
 # ---------------------------------------------------------------------------
 
 
-def call_openai(model: str, question: str, context: str, regime: RegimeConfig) -> dict[str, Any]:
-    from openai import OpenAI
+# One client per provider for the whole run, so every concurrent call shares
+# the SDK's pooled HTTP connections. SDKs are imported on first use because
+# only the provider being evaluated needs to be installed.
 
-    client = OpenAI()
-    start = time.time()
 
+@functools.cache
+def _openai_client() -> Any:
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI()
+
+
+@functools.cache
+def _gemini_client() -> Any:
+    from google import genai
+    from google.genai import types
+
+    # http_options.timeout is in milliseconds. We cap each call at 120s
+    # so the runner cannot hang indefinitely on a stuck request.
+    return genai.Client(http_options=types.HttpOptions(timeout=120_000))
+
+
+@functools.cache
+def _anthropic_client() -> Any:
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic()
+
+
+def _is_openai_reasoning(model: str) -> bool:
+    return any(model.startswith(p) for p in ("gpt-5", "o3", "o4"))
+
+
+def _openai_request(
+    model: str, question: str, context: str, regime: RegimeConfig
+) -> dict[str, Any]:
+    """Build the chat-completions request body for one question."""
     kwargs: dict[str, Any] = {
         "model": model,
         "messages": [
@@ -174,18 +270,17 @@ def call_openai(model: str, question: str, context: str, regime: RegimeConfig) -
     }
     # GPT-5 reasoning models use ``max_completion_tokens`` and ignore
     # ``temperature``; older models take the classic args.
-    is_reasoning = any(model.startswith(p) for p in ("gpt-5", "o3", "o4"))
-    if is_reasoning:
+    if _is_openai_reasoning(model):
         kwargs["max_completion_tokens"] = regime.max_output
         if regime.openai_reasoning_effort is not None:
             kwargs["reasoning_effort"] = regime.openai_reasoning_effort
     else:
         kwargs["max_tokens"] = regime.max_output
         kwargs["temperature"] = 0.0
+    return kwargs
 
-    resp = client.chat.completions.create(**kwargs)
-    latency = time.time() - start
 
+def _parse_openai_response(resp: Any, latency: float) -> dict[str, Any]:
     choice = resp.choices[0]
     text = choice.message.content or ""
     usage = resp.usage
@@ -207,15 +302,25 @@ def call_openai(model: str, question: str, context: str, regime: RegimeConfig) -
     }
 
 
-def call_gemini(model: str, question: str, context: str, regime: RegimeConfig) -> dict[str, Any]:
-    from google import genai
+# One question per chat request. Multi-prompt batching (``prompt=[...]``)
+# only exists on the legacy /v1/completions endpoint, which serves none of
+# the chat models registered below.
+async def call_openai(
+    model: str, question: str, context: str, regime: RegimeConfig
+) -> dict[str, Any]:
+    start = time.time()
+    resp = await _openai_client().chat.completions.create(
+        **_openai_request(model, question, context, regime)
+    )
+    return _parse_openai_response(resp, time.time() - start)
+
+
+async def call_gemini(
+    model: str, question: str, context: str, regime: RegimeConfig
+) -> dict[str, Any]:
     from google.genai import types
 
-    # http_options.timeout is in milliseconds. We cap each call at 120s
-    # so the runner cannot hang indefinitely on a stuck request.
-    client = genai.Client(
-        http_options=types.HttpOptions(timeout=120_000)
-    )
+    client = _gemini_client()
     start = time.time()
 
     config_kwargs: dict[str, Any] = {
@@ -228,7 +333,7 @@ def call_gemini(model: str, question: str, context: str, regime: RegimeConfig) -
             thinking_budget=regime.gemini_thinking_budget
         )
 
-    resp = client.models.generate_content(
+    resp = await client.aio.models.generate_content(
         model=model,
         contents=f"{SYSTEM_PROMPT}\n\n{_build_prompt(question, context)}",
         config=types.GenerateContentConfig(**config_kwargs),
@@ -254,16 +359,56 @@ def call_gemini(model: str, question: str, context: str, regime: RegimeConfig) -
     }
 
 
-def call_anthropic(model: str, question: str, context: str, regime: RegimeConfig) -> dict[str, Any]:
-    from anthropic import Anthropic
+# Anthropic does not cache prompt prefixes shorter than this many tokens
+# (some models need more; an unmet minimum just means no caching).
+ANTHROPIC_MIN_CACHE_TOKENS = 1024
+
+
+def _cacheable_contexts(contexts: Iterable[str]) -> frozenset[str]:
+    """Return the contexts worth marking for Anthropic prompt caching.
+
+    A cache write bills at 1.25x the input rate and only pays off when the
+    prefix is read back, so a context is marked only if it is sent more
+    than once and its prefix (system prompt plus context, at roughly one
+    token per character) can reach the minimum cacheable length.
+    """
+    counts = Counter(contexts)
+    return frozenset(
+        context
+        for context, n in counts.items()
+        if n > 1
+        and len(SYSTEM_PROMPT) + len(_prompt_prefix(context))
+        >= ANTHROPIC_MIN_CACHE_TOKENS
+    )
 
-    client = Anthropic()
-    start = time.time()
 
+def _anthropic_request(
+    model: str,
+    question: str,
+    context: str,
+    regime: RegimeConfig,
+    *,
+    cache_context: bool = False,
+) -> dict[str, Any]:
+    """Build the Messages API request params for one question."""
+    # Anthropic only caches prefixes marked with cache_control. With
+    # cache_context the system prompt and context are marked as one
+    # prefix; the question never is.
+    prefix_block: dict[str, Any] = {"type": "text", "text": _prompt_prefix(context)}
+    if cache_context:
+        prefix_block["cache_control"] = {"type": "ephemeral"}
     kwargs: dict[str, Any] = {
         "model": model,
         "system": SYSTEM_PROMPT,
-        "messages": [{"role": "user", "content": _build_prompt(question, context)}],
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    prefix_block,
+                    {"type": "text", "text": _prompt_suffix(question)},
+                ],
+            }
+        ],
         "max_tokens": regime.max_output,
         "temperature": 0.0,
     }
@@ -272,10 +417,10 @@ def call_anthropic(model: str, question: str, context: str, regime: RegimeConfig
             "type": "enabled",
             "budget_tokens": regime.anthropic_thinking_budget,
         }
+    return kwargs
 
-    resp = client.messages.create(**kwargs)
-    latency = time.time() - start
 
+def _parse_anthropic_response(resp: Any, latency: float) -> dict[str, Any]:
     text_parts: list[str] = []
     thinking_tok_from_content = 0
     for block in resp.content:
@@ -286,6 +431,12 @@ def call_anthropic(model: str, question: str, context: str, regime: RegimeConfig
     text = "\n".join(text_parts)
     usage = resp.usage
     input_tok = usage.input_tokens if usage else 0
+    # Prompt-cache writes bill at 1.25x the input rate and reads at 0.1x;
+    # neither is included in ``input_tokens``.
+    cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+    cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+    billed_input = input_tok + 1.25 * cache_write + 0.1 * cache_read
+    input_tok += cache_write + cache_read
     output_tok = usage.output_tokens if usage else 0
     # Anthropic counts thinking tokens as output tokens; they are not
     # separately reported, so we leave thinking_tokens at 0 unless we
@@ -297,11 +448,29 @@ def call_anthropic(model: str, question: str, context: str, regime: RegimeConfig
         "input_tokens": input_tok,
         "output_tokens": output_tok,
         "thinking_tokens": thinking_tok,
+        "billed_input_tokens": billed_input,
         "latency_s": latency,
         "truncated": truncated,
     }
 
 
+async def call_anthropic(
+    model: str,
+    question: str,
+    context: str,
+    regime: RegimeConfig,
+    *,
+    cache_contexts: frozenset[str] = frozenset(),
+) -> dict[str, Any]:
+    start = time.time()
+    resp = await _anthropic_client().messages.create(
+        **_anthropic_request(
+            model, question, context, regime, cache_context=context in cache_contexts
+        )
+    )
+    return _parse_anthropic_response(resp, time.time() - start)
+
+
 MODEL_REGISTRY: dict[str, tuple[Any, str]] = {
     # OpenAI
     "gpt-4o": (call_openai, "openai"),
@@ -333,7 +502,7 @@ ENV_KEYS = {
 }
 
 
-def _cost(model: str, input_tok: int, output_tok: int, thinking_tok: int) -> float:
+def _cost(model: str, input_tok: float, output_tok: int, thinking_tok: int) -> float:
     input_price, output_price, thinking_price = _price(model)
     return (
         input_tok * input_price / 1_000_000
@@ -343,7 +512,7 @@ def _cost(model: str, input_tok: int, output_tok: int, thinking_tok: int) -> flo
 
 
 def _summarize(attempts: list[Attempt]) -> dict[str, Any]:
-    from collections import Counter, defaultdict
+    from collections import defaultdict
 
     def pct(x: float) -> float:
         return round(x * 100, 2)
@@ -352,14 +521,39 @@ def _summarize(attempts: list[Attempt]) -> dict[str, Any]:
     if not total:
         return {"total": 0}
 
-    correct = sum(1 for a in attempts if a.correct)
-    parsed = sum(1 for a in attempts if a.parse_success)
-    truncated = sum(1 for a in attempts if a.truncated)
-    errored = sum(1 for a in attempts if a.error)
-
-    out_toks = [a.output_tokens for a in attempts]
-    lats = [a.latency_s for a in attempts]
-    costs = [a.cost_usd for a in attempts]
+    # One pass over attempts: overall tallies, per-group [correct, parsed,
+    # total] lists and the distributions fed to dist().
+    correct = parsed = truncated = errored = n_cached = live_correct = 0
+    out_toks: list[float] = []
+    lats: list[float] = []
+    costs: list[float] = []
+    subtask_counts: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+    acc_counts: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for a in attempts:
+        st = subtask_counts[a.subtask]
+        acc = acc_counts[a.accounting_standard]
+        st[2] += 1
+        acc[2] += 1
+        if a.correct:
+            correct += 1
+            st[0] += 1
+            acc[0] += 1
+        if a.parse_success:
+            parsed += 1
+            st[1] += 1
+        if a.truncated:
+            truncated += 1
+        if a.error:
+            errored += 1
+        out_toks.append(a.output_tokens)
+        # Cached responses cost nothing this time; keep them out of spend
+        # and latency so a warm re-run does not report the original calls.
+        if a.cached:
+            n_cached += 1
+        else:
+            lats.append(a.latency_s)
+            costs.append(a.cost_usd)
+            live_correct += a.correct
 
     def dist(xs: list[float]) -> dict[str, float]:
         if not xs:
@@ -373,34 +567,18 @@ def _summarize(attempts: list[Attempt]) -> dict[str, Any]:
             "max": round(max(xs), 3),
         }
 
-    by_subtask: dict[str, dict[str, Any]] = {}
-    subtask_counts: dict[str, Counter] = defaultdict(Counter)
-    for a in attempts:
-        c = subtask_counts[a.subtask]
-        c["total"] += 1
-        if a.correct:
-            c["correct"] += 1
-        if a.parse_success:
-            c["parsed"] += 1
-    for st, c in subtask_counts.items():
-        by_subtask[st] = {
-            "accuracy": pct(c["correct"] / c["total"]),
-            "parse_success": pct(c["parsed"] / c["total"]),
-            "total": c["total"],
-        }
-
-    by_accounting: dict[str, dict[str, Any]] = {}
-    acc_counts: dict[str, Counter] = defaultdict(Counter)
-    for a in attempts:
-        c = acc_counts[a.accounting_standard]
-        c["total"] += 1
-        if a.correct:
-            c["correct"] += 1
-    for acc, c in acc_counts.items():
-        by_accounting[acc] = {
-            "accuracy": pct(c["correct"] / c["total"]),
-            "total": c["total"],
+    by_subtask = {
+        st: {
+            "accuracy": pct(n_correct / n),
+            "parse_success": pct(n_parsed / n),
+            "total": n,
         }
+        for st, (n_correct, n_parsed, n) in subtask_counts.items()
+    }
+    by_accounting = {
+        acc: {"accuracy": pct(n_correct / n), "total": n}
+        for acc, (n_correct, _, n) in acc_counts.items()
+    }
 
     return {
         "total": total,
@@ -408,15 +586,567 @@ def _summarize(attempts: list[Attempt]) -> dict[str, Any]:
         "parse_success_pct": pct(parsed / total),
         "truncation_rate_pct": pct(truncated / total),
         "error_rate_pct": pct(errored / total),
+        "cached": n_cached,
         "output_tokens": dist(out_toks),
         "latency_s": dist(lats),
         "cost_total_usd": round(sum(costs), 4),
-        "cost_per_correct_usd": round(sum(costs) / correct, 4) if correct else None,
+        "cost_per_correct_usd": (
+            round(sum(costs) / live_correct, 4) if live_correct else None
+        ),
         "by_subtask": by_subtask,
         "by_accounting_standard": by_accounting,
     }
 
 
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+def _cache_path(
+    model: str, question: str, context: str, regime: RegimeConfig
+) -> Path | None:
+    """Return the cache file for a call, or ``None`` if it is not cacheable.
+
+    Only greedy (temperature 0) calls are cached; OpenAI reasoning
+    models ignore ``temperature`` and are always re-run.
+    """
+    if _is_openai_reasoning(model):
+        return None
+    payload = {
+        "model": model,
+        "sys": SYSTEM_PROMPT,
+        "user": _build_prompt(question, context),
+        "temp": 0.0,
+        "regime": asdict(regime),
+    }
+    # Always stdlib json: the key must not depend on whether orjson is installed.
+    key = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    return CACHE_DIR / model / f"{key}.json"
+
+
+def _cache_load(path: Path | None) -> dict[str, Any] | None:
+    if path is None or not path.exists():
+        return None
+    cached: dict[str, Any] = _loads(path.read_text(encoding="utf-8"))
+    return cached
+
+
+def _cache_store(path: Path | None, result: dict[str, Any]) -> None:
+    """Write *result* atomically so an interrupted run leaves no partial file."""
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(_dumps(result), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+MAX_RATE_LIMIT_RETRIES = 3
+DEFAULT_RETRY_AFTER_S = 5.0
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at ``per_minute`` units/min.
+
+    Used both as a request-per-minute limiter (one unit per call) and as
+    a token-per-minute limiter (estimated tokens per call).
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.refill_per_s = per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until *amount* units are available, then consume them."""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.refill_per_s,
+                )
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.refill_per_s)
+
+
+def _estimate_tokens(question: str, context: str, regime: RegimeConfig) -> int:
+    """Upper-bound token cost of one call for the TPM bucket.
+
+    Japanese text tokenizes at roughly one token per character, so the
+    prompt length in characters is used directly. Providers count
+    ``max_tokens`` against TPM, so the full output budget is reserved.
+    """
+    prompt_chars = len(SYSTEM_PROMPT) + len(_build_prompt(question, context))
+    return prompt_chars + regime.max_output
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Return the wait in seconds if *exc* is a 429, else ``None``."""
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status != 429:
+        return None
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after", DEFAULT_RETRY_AFTER_S))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_S
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def _load_attempts(pred_path: Path) -> dict[str, Attempt]:
+    """Read a predictions JSONL file; later lines override earlier ones.
+
+    A partial last line left by an interrupted run is skipped and
+    terminated, so the next append starts on a fresh line.
+    """
+    attempts: dict[str, Attempt] = {}
+    line = ""
+    with pred_path.open(encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            attempts[record["id"]] = Attempt(**record)
+    if line and not line.endswith("\n"):
+        with pred_path.open("a", encoding="utf-8") as f:
+            f.write("\n")
+    return attempts
+
+
+def _convert_legacy_predictions(legacy_path: Path, pred_path: Path) -> None:
+    """Write a legacy ``{id: attempt}`` predictions JSON file as JSONL."""
+    saved: dict[str, dict[str, Any]] = json.loads(
+        legacy_path.read_text(encoding="utf-8")
+    )
+    tmp = pred_path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        for record in saved.values():
+            f.write(_dumps(record) + "\n")
+    os.replace(tmp, pred_path)
+    print(f"Converted {len(saved)} attempts from {legacy_path.name}")
+
+
+def _append_attempt(pred_file: TextIO, attempt: Attempt) -> None:
+    pred_file.write(_dumps(asdict(attempt)) + "\n")
+    pred_file.flush()
+
+
+@dataclass
+class Dispatcher:
+    """Per-run state shared by all in-flight provider calls."""
+
+    call_fn: Any
+    model: str
+    regime: RegimeConfig
+    semaphore: asyncio.Semaphore
+    rpm_limiter: TokenBucket
+    tpm_limiter: TokenBucket
+
+
+async def _call_provider(
+    dispatcher: Dispatcher, question: str, context: str
+) -> dict[str, Any]:
+    """Call the provider under the concurrency and rate limits.
+
+    Retries on 429 after ``Retry-After``; any other error propagates.
+    """
+    d = dispatcher
+    est_tokens = _estimate_tokens(question, context, d.regime)
+    async with d.semaphore:
+        for retry in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await d.rpm_limiter.acquire()
+            await d.tpm_limiter.acquire(est_tokens)
+            try:
+                result: dict[str, Any] = await d.call_fn(
+                    d.model, question, context, d.regime
+                )
+                return result
+            except Exception as exc:
+                wait = _retry_after(exc)
+                if wait is None or retry == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                await asyncio.sleep(wait)
+    msg = "unreachable"
+    raise AssertionError(msg)
+
+
+async def _fetch_response(
+    dispatcher: Dispatcher, question: str, context: str
+) -> tuple[dict[str, Any], bool]:
+    """Return the provider response and whether it came from the disk cache."""
+    cache_path = _cache_path(dispatcher.model, question, context, dispatcher.regime)
+    cached = _cache_load(cache_path)
+    if cached is not None:
+        return cached, True
+    result = await _call_provider(dispatcher, question, context)
+    _cache_store(cache_path, result)
+    return result, False
+
+
+def _new_attempt(row: dict[str, Any]) -> tuple[Attempt, str]:
+    """Return an unscored Attempt for *row* and its formatted context."""
+    from jfinqa.models import Question
+
+    q = Question.model_validate(row)
+
+    attempt = Attempt(
+        id=q.id,
+        subtask=q.subtask.value,
+        accounting_standard=row.get("accounting_standard", ""),
+        company_name=row.get("company_name", ""),
+        question=q.qa.question,
+        gold=q.qa.answer,
+        predicted="",
+        raw_response="",
+        correct=False,
+        parse_success=False,
+        truncated=False,
+        input_tokens=0,
+        output_tokens=0,
+        thinking_tokens=0,
+        latency_s=0.0,
+        cost_usd=0.0,
+    )
+    return attempt, q.format_context()
+
+
+def _score_attempt(
+    attempt: Attempt,
+    result: dict[str, Any],
+    model: str,
+    *,
+    price_factor: float = 1.0,
+    cached: bool = False,
+) -> None:
+    """Fill *attempt* from a provider response and score it."""
+    from jfinqa._metrics import numerical_match
+
+    predicted, parse_ok = _extract_answer(result["text"])
+    attempt.raw_response = result["text"]
+    attempt.predicted = predicted
+    attempt.parse_success = parse_ok
+    attempt.truncated = result["truncated"]
+    attempt.input_tokens = result["input_tokens"]
+    attempt.output_tokens = result["output_tokens"]
+    attempt.thinking_tokens = result["thinking_tokens"]
+    attempt.latency_s = round(result["latency_s"], 3)
+    attempt.cost_usd = round(
+        price_factor
+        * _cost(
+            model,
+            result.get("billed_input_tokens", result["input_tokens"]),
+            result["output_tokens"],
+            result["thinking_tokens"],
+        ),
+        6,
+    )
+    attempt.correct = bool(parse_ok) and numerical_match(predicted, attempt.gold)
+    attempt.cached = cached
+
+
+async def _attempt_question(row: dict[str, Any], dispatcher: Dispatcher) -> Attempt:
+    """Call the model on one question and score the response."""
+    attempt, context = _new_attempt(row)
+    try:
+        result, cached = await _fetch_response(dispatcher, attempt.question, context)
+    except Exception as exc:
+        attempt.error = f"{type(exc).__name__}: {exc}"
+        return attempt
+
+    _score_attempt(attempt, result, dispatcher.model, cached=cached)
+    return attempt
+
+
+async def _run_all(
+    rows: list[dict[str, Any]],
+    attempts: dict[str, Attempt],
+    *,
+    call_fn: Any,
+    model: str,
+    regime: RegimeConfig,
+    pred_file: TextIO,
+    concurrency: int,
+    rpm: int,
+    tpm: int,
+) -> None:
+    """Run all unanswered questions concurrently, updating *attempts*."""
+    dispatcher = Dispatcher(
+        call_fn=call_fn,
+        model=model,
+        regime=regime,
+        semaphore=asyncio.Semaphore(max(1, concurrency)),
+        rpm_limiter=TokenBucket(rpm),
+        tpm_limiter=TokenBucket(tpm),
+    )
+    tasks = [
+        asyncio.create_task(_attempt_question(row, dispatcher))
+        for row in rows
+        if row["id"] not in attempts
+    ]
+
+    n_total = len(rows)
+    done = len(attempts)
+    consecutive_errors = 0
+    for fut in asyncio.as_completed(tasks):
+        attempt = await fut
+        attempts[attempt.id] = attempt
+        _append_attempt(pred_file, attempt)
+        done += 1
+
+        if attempt.error:
+            consecutive_errors += 1
+            print(f"[{done}/{n_total}] ERR {attempt.id}: {attempt.error}")
+            if consecutive_errors >= 5:
+                print("5 consecutive errors, stopping.")
+                break
+        else:
+            consecutive_errors = 0
+            status = (
+                "OK" if attempt.correct else ("TR" if attempt.truncated else "NG")
+            )
+            print(
+                f"[{done}/{n_total}] {status} {attempt.id}: "
+                f"pred={attempt.predicted!r} gold={attempt.gold!r} "
+                f"tok={attempt.output_tokens}+{attempt.thinking_tokens}th "
+                + ("cached" if attempt.cached else f"${attempt.cost_usd:.4f}")
+            )
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ---------------------------------------------------------------------------
+# Batch API mode
+# ---------------------------------------------------------------------------
+
+BATCH_POLL_INTERVAL_S = 60
+# OpenAI Batch and Anthropic Message Batches both bill at 50% of list price.
+BATCH_PRICE_FACTOR = 0.5
+
+
+def _submit_openai_batch(
+    model: str, regime: RegimeConfig, pending: list[tuple[str, str, str]]
+) -> str:
+    """Submit *pending* ``(qid, question, context)`` as one OpenAI batch job."""
+    from openai import OpenAI
+
+    client = OpenAI()
+    lines = [
+        json.dumps(
+            {
+                "custom_id": qid,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": _openai_request(model, question, context, regime),
+            },
+            ensure_ascii=False,
+        )
+        for qid, question, context in pending
+    ]
+    input_file = client.files.create(
+        file=("jfinqa_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted OpenAI batch {batch.id} ({len(pending)} requests)")
+    batch_id: str = batch.id
+    return batch_id
+
+
+def _collect_openai_batch(batch_id: str) -> dict[str, dict[str, Any]]:
+    """Poll an OpenAI batch job until it ends and parse its results."""
+    from openai import OpenAI
+    from openai.types.chat import ChatCompletion
+
+    client = OpenAI()
+    batch = client.batches.retrieve(batch_id)
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(BATCH_POLL_INTERVAL_S)
+        batch = client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        done = f"{counts.completed}/{counts.total}" if counts else "?"
+        print(f"  {batch_id}: {batch.status} ({done})")
+
+    results: dict[str, dict[str, Any]] = {}
+    if batch.output_file_id:
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                resp = ChatCompletion.model_validate(response["body"])
+                results[record["custom_id"]] = _parse_openai_response(resp, 0.0)
+    return results
+
+
+def _submit_anthropic_batch(
+    model: str, regime: RegimeConfig, pending: list[tuple[str, str, str]]
+) -> str:
+    """Submit *pending* ``(qid, question, context)`` as one Message Batch."""
+    from anthropic import Anthropic
+
+    client = Anthropic()
+    shared = _cacheable_contexts(context for _, _, context in pending)
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": qid,
+                "params": _anthropic_request(
+                    model, question, context, regime, cache_context=context in shared
+                ),
+            }
+            for qid, question, context in pending
+        ]
+    )
+    print(f"Submitted Anthropic batch {batch.id} ({len(pending)} requests)")
+    batch_id: str = batch.id
+    return batch_id
+
+
+def _collect_anthropic_batch(batch_id: str) -> dict[str, dict[str, Any]]:
+    """Poll a Message Batch until it ends and parse its results."""
+    from anthropic import Anthropic
+
+    client = Anthropic()
+    batch = client.messages.batches.retrieve(batch_id)
+    while batch.processing_status != "ended":
+        time.sleep(BATCH_POLL_INTERVAL_S)
+        batch = client.messages.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        print(
+            f"  {batch_id}: {batch.processing_status} "
+            f"({counts.succeeded} ok, {counts.processing} processing)"
+        )
+
+    results: dict[str, dict[str, Any]] = {}
+    for entry in client.messages.batches.results(batch_id):
+        if entry.result.type == "succeeded":
+            results[entry.custom_id] = _parse_anthropic_response(
+                entry.result.message, 0.0
+            )
+    return results
+
+
+# provider -> (submit, collect)
+BATCH_RUNNERS: dict[str, tuple[Any, Any]] = {
+    "openai": (_submit_openai_batch, _collect_openai_batch),
+    "anthropic": (_submit_anthropic_batch, _collect_anthropic_batch),
+}
+
+
+def _save_batch_state(state_path: Path, batch_id: str, qids: list[str]) -> None:
+    """Record a submitted batch job so an interrupted run can resume it."""
+    tmp = state_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"batch_id": batch_id, "ids": qids}), encoding="utf-8")
+    os.replace(tmp, state_path)
+
+
+def _run_batch(
+    rows: list[dict[str, Any]],
+    attempts: dict[str, Attempt],
+    *,
+    model: str,
+    regime: RegimeConfig,
+    provider: str,
+    pred_file: TextIO,
+    state_path: Path,
+) -> None:
+    """Answer all unanswered questions through the provider's Batch API.
+
+    Cached responses are scored directly; the rest are submitted as a
+    single batch job and polled until it finishes. No client-side rate
+    limiting is needed since batch jobs have their own quota.
+
+    The job id is saved to *state_path* right after submission. If that
+    file exists, the recorded job is polled again instead of submitting
+    a new one, so an interrupted run is not billed twice. Questions the
+    job did not answer are not recorded and are retried on the next run.
+    """
+    submit, collect = BATCH_RUNNERS[provider]
+
+    # Older runs recorded failed batch requests as attempts; retry them.
+    failed = [q for q, a in attempts.items() if (a.error or "").startswith("Batch")]
+    for qid in failed:
+        del attempts[qid]
+
+    if state_path.exists():
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        batch_id = state["batch_id"]
+        in_batch = set(state["ids"])
+        pending = [
+            _new_attempt(row)
+            for row in rows
+            if row["id"] in in_batch and row["id"] not in attempts
+        ]
+        print(f"Resuming batch {batch_id} ({len(pending)} requests)")
+    else:
+        pending = []
+        for row in rows:
+            if row["id"] in attempts:
+                continue
+            attempt, context = _new_attempt(row)
+            hit = _cache_load(_cache_path(model, attempt.question, context, regime))
+            if hit is not None:
+                _score_attempt(attempt, hit, model, cached=True)
+                attempts[attempt.id] = attempt
+                _append_attempt(pred_file, attempt)
+            else:
+                pending.append((attempt, context))
+
+        if not pending:
+            return
+
+        batch_id = submit(
+            model, regime, [(a.id, a.question, ctx) for a, ctx in pending]
+        )
+        _save_batch_state(state_path, batch_id, [a.id for a, _ in pending])
+
+    results = collect(batch_id)
+    n_ok = 0
+    for attempt, context in pending:
+        result = results.get(attempt.id)
+        if result is None:
+            continue
+        _cache_store(_cache_path(model, attempt.question, context, regime), result)
+        _score_attempt(attempt, result, model, price_factor=BATCH_PRICE_FACTOR)
+        attempts[attempt.id] = attempt
+        _append_attempt(pred_file, attempt)
+        n_ok += 1
+    state_path.unlink()
+    print(f"Batch finished: {n_ok}/{len(pending)} succeeded")
+    if n_ok < len(pending):
+        print("Unanswered questions were not recorded; re-run to retry them.")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run jfinqa baseline")
     parser.add_argument("--model", required=True, choices=list(MODEL_REGISTRY.keys()))
@@ -426,6 +1156,23 @@ def main() -> None:
         default=str(ROOT / "scripts" / "data" / "final" / "jfinqa_v1.json"),
     )
     parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of API calls in flight at once",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit via the provider Batch API (OpenAI/Anthropic, 50%% cost)",
+    )
+    parser.add_argument(
+        "--rpm", type=int, default=500, help="Request-per-minute limit"
+    )
+    parser.add_argument(
+        "--tpm", type=int, default=1_000_000, help="Token-per-minute limit"
+    )
     parser.add_argument(
         "--out-dir",
         default=str(ROOT / "scripts" / "data" / "baselines"),
@@ -438,6 +1185,9 @@ def main() -> None:
     if not os.environ.get(key_name):
         print(f"Error: {key_name} is not set. Run: source ~/.tokens")
         sys.exit(1)
+    if args.batch_api and provider not in BATCH_RUNNERS:
+        print(f"Error: --batch-api is not supported for {provider} models")
+        sys.exit(1)
 
     with open(args.data, encoding="utf-8") as f:
         rows = json.load(f)
@@ -447,123 +1197,54 @@ def main() -> None:
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     run_id = f"{args.model}__{args.regime}"
-    pred_path = out_dir / f"{run_id}__predictions.json"
+    pred_path = out_dir / f"{run_id}__predictions.jsonl"
     metrics_path = out_dir / f"{run_id}__metrics.json"
 
+    legacy_path = out_dir / f"{run_id}__predictions.json"
+    if not pred_path.exists() and legacy_path.exists():
+        _convert_legacy_predictions(legacy_path, pred_path)
+
     attempts: dict[str, Attempt] = {}
     if pred_path.exists():
-        saved = json.loads(pred_path.read_text(encoding="utf-8"))
-        for qid, record in saved.items():
-            attempts[qid] = Attempt(**record)
+        attempts = _load_attempts(pred_path)
         print(f"Resuming: {len(attempts)} existing attempts loaded")
 
-    from jfinqa._metrics import numerical_match
-    from jfinqa.models import QAPair, Question, Subtask, Table
-
     print(f"Model: {args.model}  Regime: {regime.name}  Questions: {len(rows)}")
 
-    consecutive_errors = 0
-    for i, row in enumerate(rows):
-        qid = row["id"]
-        if qid in attempts:
-            continue
-        question_obj = Question(
-            id=qid,
-            subtask=Subtask(row["subtask"]),
-            pre_text=row["pre_text"],
-            post_text=row["post_text"],
-            table=Table(
-                headers=row["table"]["headers"], rows=row["table"]["rows"]
-            ),
-            qa=QAPair(
-                question=row["qa"]["question"],
-                program=row["qa"]["program"],
-                answer=row["qa"]["answer"],
-                gold_evidence=row["qa"]["gold_evidence"],
-            ),
-        )
-        context = question_obj.format_context()
-        gold = row["qa"]["answer"]
-
-        attempt = Attempt(
-            id=qid,
-            subtask=row["subtask"],
-            accounting_standard=row.get("accounting_standard", ""),
-            company_name=row.get("company_name", ""),
-            question=row["qa"]["question"],
-            gold=gold,
-            predicted="",
-            raw_response="",
-            correct=False,
-            parse_success=False,
-            truncated=False,
-            input_tokens=0,
-            output_tokens=0,
-            thinking_tokens=0,
-            latency_s=0.0,
-            cost_usd=0.0,
-        )
-        try:
-            result = call_fn(args.model, row["qa"]["question"], context, regime)
-            predicted, parse_ok = _extract_answer(result["text"])
-            attempt.raw_response = result["text"]
-            attempt.predicted = predicted
-            attempt.parse_success = parse_ok
-            attempt.truncated = result["truncated"]
-            attempt.input_tokens = result["input_tokens"]
-            attempt.output_tokens = result["output_tokens"]
-            attempt.thinking_tokens = result["thinking_tokens"]
-            attempt.latency_s = round(result["latency_s"], 3)
-            attempt.cost_usd = round(
-                _cost(
-                    args.model,
-                    result["input_tokens"],
-                    result["output_tokens"],
-                    result["thinking_tokens"],
-                ),
-                6,
+    # Each finished attempt is appended as one JSON line, so progress is
+    # durable without re-serializing the whole run.
+    with pred_path.open("a", encoding="utf-8") as pred_file:
+        if args.batch_api:
+            _run_batch(
+                rows,
+                attempts,
+                model=args.model,
+                regime=regime,
+                provider=provider,
+                pred_file=pred_file,
+                state_path=out_dir / f"{run_id}__batch.json",
             )
-            attempt.correct = bool(parse_ok) and numerical_match(predicted, gold)
-            consecutive_errors = 0
-            status = "OK" if attempt.correct else ("TR" if attempt.truncated else "NG")
-            print(
-                f"[{i+1}/{len(rows)}] {status} {qid}: "
-                f"pred={predicted!r} gold={gold!r} "
-                f"tok={attempt.output_tokens}+{attempt.thinking_tokens}th "
-                f"${attempt.cost_usd:.4f}"
+        else:
+            if provider == "anthropic":
+                shared = _cacheable_contexts(
+                    _new_attempt(row)[1] for row in rows if row["id"] not in attempts
+                )
+                print(f"Prompt caching: {len(shared)} shared contexts marked")
+                call_fn = functools.partial(call_anthropic, cache_contexts=shared)
+            asyncio.run(
+                _run_all(
+                    rows,
+                    attempts,
+                    call_fn=call_fn,
+                    model=args.model,
+                    regime=regime,
+                    pred_file=pred_file,
+                    concurrency=args.concurrency,
+                    rpm=args.rpm,
+                    tpm=args.tpm,
+                )
             )
-        except Exception as exc:
-            attempt.error = f"{type(exc).__name__}: {exc}"
-            consecutive_errors += 1
-            print(f"[{i+1}/{len(rows)}] ERR {qid}: {attempt.error}")
-            if consecutive_errors >= 5:
-                print("5 consecutive errors, stopping.")
-                break
-            time.sleep(2)
-
-        attempts[qid] = attempt
-
-        # Persist every 10 items
-        if (i + 1) % 10 == 0:
-            pred_path.write_text(
-                json.dumps(
-                    {k: asdict(v) for k, v in attempts.items()},
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
-            )
-        # Gentle rate-limit
-        time.sleep(0.2)
 
-    pred_path.write_text(
-        json.dumps(
-            {k: asdict(v) for k, v in attempts.items()},
-            ensure_ascii=False,
-            indent=2,
-        ),
-        encoding="utf-8",
-    )
     data_path = Path(args.data).resolve()
     try:
         data_rel = str(data_path.relative_to(ROOT))
@@ -587,7 +1268,8 @@ def main() -> None:
     print(f"Accuracy: {s['accuracy_pct']}%  Parse: {s['parse_success_pct']}%  "
           f"Truncation: {s['truncation_rate_pct']}%")
     print(f"Cost: ${s['cost_total_usd']:.4f}  "
-          f"Cost/correct: ${s['cost_per_correct_usd']}")
+          f"Cost/correct: ${s['cost_per_correct_usd']}  "
+          f"Cached: {s['cached']}")
     print(f"Output tok p50/p90/p95: "
           f"{s['output_tokens'].get('median', 0)}/"
           f"{s['output_tokens'].get('p90', 0)}/"
@@ -10,15 +10,48 @@ Requires:
 
 from __future__ import annotations
 
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from datasets import Dataset
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+from datasets import Dataset, Features, Sequence, Value
 from huggingface_hub import HfApi
 
 HF_REPO = "ajtgjmdjp/jfinqa"
 DATA_PATH = Path(__file__).parent / "data" / "final" / "jfinqa_v1.json"
 CARD_PATH = Path(__file__).parent / "hf_dataset_card.md"
+_STR = Value("string")
+
+# Schema of the flattened records (must match _flatten_question). Declared
+# up front so from_generator writes Arrow directly without inferring types.
+FEATURES = Features(
+    {
+        "id": _STR,
+        "subtask": _STR,
+        "company_name": _STR,
+        "edinet_code": _STR,
+        "source_doc_id": _STR,
+        "filing_year": _STR,
+        "accounting_standard": _STR,
+        "scale": _STR,
+        "pre_text": Sequence(_STR),
+        "post_text": Sequence(_STR),
+        "table_headers": Sequence(_STR),
+        "table_rows": Sequence(Sequence(_STR)),
+        "question": _STR,
+        "answer": _STR,
+        "program": Sequence(_STR),
+        "gold_evidence": Sequence(Value("int64")),
+    }
+)
+
+# Concurrent config uploads; kept low to stay under Hub rate limits.
+PUSH_WORKERS = 4
 
 
 def _flatten_question(q: dict) -> dict:
@@ -45,40 +78,56 @@ def _flatten_question(q: dict) -> dict:
     }
 
 
+def _iter_flat(questions: list[dict]) -> Iterator[dict]:
+    """Yield flattened records in dataset order."""
+    for q in questions:
+        yield _flatten_question(q)
+
+
 def main() -> None:
     with open(DATA_PATH, encoding="utf-8") as f:
         raw = json.load(f)
 
     print(f"Loaded {len(raw)} questions from {DATA_PATH}")
 
-    # Split by subtask
-    by_subtask: dict[str, list[dict]] = {}
-    for q in raw:
-        st = q["subtask"]
-        by_subtask.setdefault(st, []).append(_flatten_question(q))
+    # Flatten every question exactly once, streaming the records into Arrow
+    # via from_generator so no flattened copy is held alongside the table.
+    # The per-subtask configs are then filtered from that table.
+    all_ds = Dataset.from_generator(
+        functools.partial(_iter_flat, raw), features=FEATURES
+    )
 
-    # Create DatasetDict with subtask configs
+    # Build one config per subtask
     configs: dict[str, Dataset] = {}
-    for subtask_name, questions in sorted(by_subtask.items()):
-        ds = Dataset.from_list(questions)
+    for subtask_name in sorted(set(all_ds["subtask"])):
+        ds = all_ds.filter(
+            functools.partial(str.__eq__, subtask_name), input_columns="subtask"
+        )
         configs[subtask_name] = ds
         print(f"  {subtask_name}: {len(ds)} questions")
 
     # Also create "all" config with everything
-    all_questions = [_flatten_question(q) for q in raw]
-    configs["all"] = Dataset.from_list(all_questions)
-    print(f"  all: {len(all_questions)} questions")
-
-    # Push each config as a separate dataset split
-    for config_name, ds in configs.items():
-        print(f"\nUploading config '{config_name}'...")
-        ds.push_to_hub(
-            HF_REPO,
-            config_name=config_name,
-            split="test",
-            private=False,
-        )
-        print(f"  Done: {config_name}")
+    configs["all"] = all_ds
+    print(f"  all: {len(all_ds)} questions")
+
+    # Push each config as a separate dataset split. Uploads are independent
+    # so they run in parallel; the README metadata each push rewrites is
+    # replaced by the dataset card below once all of them have finished.
+    with ThreadPoolExecutor(max_workers=PUSH_WORKERS) as pool:
+        futures = {
+            pool.submit(
+                ds.push_to_hub,
+                HF_REPO,
+                config_name=config_name,
+                split="test",
+                private=False,
+            ): config_name
+            for config_name, ds in configs.items()
+        }
+        print(f"\nUploading {len(futures)} configs...")
+        for future in as_completed(futures):
+            future.result()
+            print(f"  Done: {futures[future]}")
 
     # Upload dataset card (README.md)
     if CARD_PATH.exists():
@@ -10,7 +10,7 @@ Quick start::
     print(result.summary())
 """
 
-from jfinqa.dataset import load_dataset, load_from_file
+from jfinqa.dataset import load_dataset, load_from_file, load_from_parquet
 from jfinqa.evaluate import evaluate
 from jfinqa.models import (
     BenchmarkResult,
@@ -33,6 +33,7 @@ __all__ = [
     "evaluate",
     "load_dataset",
     "load_from_file",
+    "load_from_parquet",
 ]
 
 __version__ = "0.3.2"
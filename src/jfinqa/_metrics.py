@@ -14,6 +14,8 @@ keep both copies in sync.
 
 from __future__ import annotations
 
+import functools
+import math
 import re
 import unicodedata
 
@@ -38,7 +40,22 @@ _UNIT_SUFFIXES = (
     "bps",
 )
 
+# Japanese negative markers, recognized at the start of an answer
+_NEGATIVE_MARKERS = ("△", "▲")
 
+# Patterns compiled once at import; these run on every comparison.
+_NUMBER_COMMA_RE = re.compile(r"(?<=\d),(?=\d)")
+_NON_NUMERIC_RE = re.compile(r"[^\d.\-+]")
+
+# Plain ASCII numbers ("0", "-3.5", "25%") that float() parses directly
+_SIMPLE_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?%?", re.ASCII)
+
+# Answer strings repeat heavily (gold labels, "0", common percentages), so
+# the pure string -> value functions below are memoized.
+_CACHE_SIZE = 1 << 17
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def normalize_answer(answer: str) -> str:
     """Normalize an answer string for comparison.
 
@@ -70,14 +87,19 @@ def normalize_answer(answer: str) -> str:
 
     s = answer.strip()
 
-    # NFKC normalization: fullwidth → halfwidth digits/letters
-    s = unicodedata.normalize("NFKC", s)
+    # NFKC and the negative markers only affect non-ASCII text, so plain
+    # ASCII answers (most model output) skip both steps.
+    if not s.isascii():
+        # NFKC normalization: fullwidth → halfwidth digits/letters
+        s = unicodedata.normalize("NFKC", s)
 
-    # Japanese negative markers → minus sign
-    s = re.sub(r"^[△▲]", "-", s)
+        # Japanese negative markers → minus sign
+        if s.startswith(_NEGATIVE_MARKERS):
+            s = "-" + s[1:]
 
     # Remove commas in numbers (e.g., "1,234,567" → "1234567")
-    s = re.sub(r"(?<=\d),(?=\d)", "", s)
+    if "," in s:
+        s = _NUMBER_COMMA_RE.sub("", s)
 
     # Normalize Japanese verb endings for categorical answers
     # e.g., "改善した" → "改善", "悪化した" → "悪化"
@@ -111,20 +133,31 @@ def extract_number(text: str) -> float | None:
         -42.5
         >>> extract_number("増加")
     """
-    s = normalize_answer(text)
+    return _extract_normalized(normalize_answer(text))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _extract_normalized(s: str) -> float | None:
+    """Parse the output of :func:`normalize_answer` as a number."""
     if not s:
         return None
 
-    # Strip unit suffixes for parsing
+    # Plain numbers need neither the unit nor the kanji handling below
+    if _SIMPLE_NUMBER_RE.fullmatch(s):
+        return float(s.removesuffix("%"))
+
+    # Strip unit suffixes for parsing. Every suffix is tried in turn, so
+    # stacked units ("千円百万円") are all removed.
     for suffix in _UNIT_SUFFIXES:
         s = s.removesuffix(suffix)
 
-    # Check for kanji multiplier (e.g., "100億" → 100 * 1e8)
+    # Check for kanji multiplier (e.g., "100億" → 100 * 1e8). The first
+    # multiplier in dict order wins, as in the lm-evaluation-harness copy.
     for kanji, multiplier in _KANJI_MULTIPLIERS.items():
         if kanji in s:
             num_part = s.replace(kanji, "").strip()
             # Remove remaining unit text
-            num_part = re.sub(r"[^\d.\-+]", "", num_part)
+            num_part = _NON_NUMERIC_RE.sub("", num_part)
             try:
                 return float(num_part) * multiplier
             except ValueError:
@@ -136,7 +169,7 @@ def extract_number(text: str) -> float | None:
         s = s.removesuffix("%")
 
     # Try to parse the remaining string as a number
-    s = re.sub(r"[^\d.\-+]", "", s)
+    s = _NON_NUMERIC_RE.sub("", s)
     try:
         return float(s)
     except ValueError:
@@ -159,6 +192,9 @@ def exact_match(predicted: str, gold: str) -> bool:
         >>> exact_match("△1,000", "-1000")
         True
     """
+    # Identical strings normalize identically
+    if predicted == gold:
+        return True
     return normalize_answer(predicted) == normalize_answer(gold)
 
 
@@ -188,14 +224,71 @@ def numerical_match(
         >>> numerical_match("24956百万円", "24956")
         True
     """
-    pred_num = extract_number(predicted)
-    gold_num = extract_number(gold)
+    # Identical strings normalize identically
+    if predicted == gold:
+        return True
+
+    # Plain numbers on both sides need none of the normalization steps
+    pred_s = predicted.strip()
+    gold_s = gold.strip()
+    if _SIMPLE_NUMBER_RE.fullmatch(pred_s) and _SIMPLE_NUMBER_RE.fullmatch(gold_s):
+        return _within_tolerance(
+            float(pred_s.removesuffix("%")),
+            float(gold_s.removesuffix("%")),
+            rel_tolerance,
+        )
+
+    pred_norm = normalize_answer(predicted)
+    gold_norm = normalize_answer(gold)
+
+    # Equal normalized strings always parse to equal numbers (or both
+    # fail), so this settles categorical answers without parsing.
+    if pred_norm == gold_norm:
+        return True
+
+    pred_num = _extract_normalized(pred_norm)
+    gold_num = _extract_normalized(gold_norm)
 
     if pred_num is None or gold_num is None:
-        return exact_match(predicted, gold)
+        return False
+
+    return _within_tolerance(pred_num, gold_num, rel_tolerance)
+
 
+def _within_tolerance(pred_num: float, gold_num: float, rel_tolerance: float) -> bool:
+    """Compare two parsed answers with a relative tolerance on the gold."""
     if gold_num == 0:
         return pred_num == 0
 
     rel_diff = abs(pred_num - gold_num) / abs(gold_num)
     return rel_diff <= rel_tolerance
+
+
+def wilson_interval(correct: int, total: int, z: float = 1.96) -> tuple[float, float]:
+    """Wilson score interval for an accuracy of ``correct / total``.
+
+    Args:
+        correct: Number of correct predictions.
+        total: Number of questions; must be positive.
+        z: Standard normal quantile (default: 1.96 for 95%).
+
+    Returns:
+        ``(lower, upper)`` bounds of the interval.
+
+    Examples:
+        >>> lo, hi = wilson_interval(3, 4)
+        >>> f"{lo:.3f} {hi:.3f}"
+        '0.301 0.954'
+    """
+    p = correct / total
+    z2 = z * z
+    denom = 1 + z2 / total
+    center = (p + z2 / (2 * total)) / denom
+    half = z * math.sqrt(p * (1 - p) / total + z2 / (4 * total * total)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def clear_caches() -> None:
+    """Drop all memoized normalization and parsing results."""
+    normalize_answer.cache_clear()
+    _extract_normalized.cache_clear()
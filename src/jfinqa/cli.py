@@ -36,9 +36,11 @@ def _load_questions(data: str | None, subtask: str | None) -> list[Question]:
 
     Optionally filters by subtask.
     """
-    from jfinqa.dataset import load_dataset, load_from_file
+    from jfinqa.dataset import load_dataset, load_from_file, load_from_parquet
 
-    if data:
+    if data and data.endswith(".parquet"):
+        questions = load_from_parquet(data)
+    elif data:
         questions = load_from_file(data)
     else:
         questions = load_dataset(subtask)
@@ -71,7 +73,7 @@ def _load_questions(data: str | None, subtask: str | None) -> list[Question]:
     "-d",
     default=None,
     type=click.Path(exists=True),
-    help="Local data file (JSON/JSONL). If omitted, loads from HuggingFace.",
+    help="Local data file (JSON/JSONL/Parquet). If omitted, loads from HuggingFace.",
 )
 @click.option(
     "--match-mode",
@@ -150,7 +152,7 @@ def evaluate(
     "-d",
     default=None,
     type=click.Path(exists=True),
-    help="Local data file (JSON/JSONL). If omitted, loads from HuggingFace.",
+    help="Local data file (JSON/JSONL/Parquet). If omitted, loads from HuggingFace.",
 )
 @click.option(
     "--limit",
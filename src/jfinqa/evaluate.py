@@ -19,11 +19,19 @@ Examples::
 
     result = evaluate(questions, model_fn=my_model)
     print(result.summary())
+
+    # With a batched model function
+    def my_batch_model(questions: list[str], contexts: list[str]) -> list[str]:
+        return ["42.5%"] * len(questions)
+
+    result = evaluate(questions, model_fn_batch=my_batch_model, batch_size=32)
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
+import functools
+import itertools
+from collections import Counter
 from typing import Any, Protocol
 
 from loguru import logger
@@ -33,6 +41,7 @@ from jfinqa.models import (
     BenchmarkResult,
     Question,
     QuestionResult,
+    Subtask,
     SubtaskResult,
 )
 
@@ -43,76 +52,137 @@ class ModelFn(Protocol):
     def __call__(self, question: str, context: str) -> str: ...
 
 
+class ModelBatchFn(Protocol):
+    """Protocol for batched model callable used in evaluation."""
+
+    def __call__(self, questions: list[str], contexts: list[str]) -> list[str]: ...
+
+
 def evaluate(
     questions: list[Question],
     *,
     predictions: dict[str, str] | None = None,
     model_fn: ModelFn | Any | None = None,
+    model_fn_batch: ModelBatchFn | Any | None = None,
+    batch_size: int = 16,
     match_mode: str = "numerical",
     numerical_tolerance: float = 0.01,
+    detailed: bool = True,
 ) -> BenchmarkResult:
     """Evaluate model predictions against gold answers.
 
-    Exactly one of ``predictions`` or ``model_fn`` must be provided.
+    Exactly one of ``predictions``, ``model_fn`` or ``model_fn_batch``
+    must be provided.
 
     Args:
         questions: List of benchmark questions to evaluate.
         predictions: Mapping of question ID to predicted answer string.
         model_fn: A callable ``(question, context) -> answer`` that
             generates predictions on the fly.
+        model_fn_batch: A callable ``(questions, contexts) -> answers``
+            that generates predictions for a batch of questions at once,
+            returning one answer per question in order.
+        batch_size: Number of questions per ``model_fn_batch`` call
+            (default: 16).
         match_mode: Comparison strategy: ``"exact"`` for string match,
             ``"numerical"`` for numeric tolerance (default).
         numerical_tolerance: Relative tolerance for numerical matching
             (default: 1%).
+        detailed: Whether to keep a :class:`QuestionResult` per question
+            in ``results``. Pass ``False`` when only the aggregate
+            metrics are needed; ``results`` is then empty.
 
     Returns:
         :class:`BenchmarkResult` with overall and per-subtask metrics.
 
     Raises:
-        ValueError: If neither or both of ``predictions`` and
-            ``model_fn`` are provided.
+        ValueError: If not exactly one of ``predictions``, ``model_fn``
+            and ``model_fn_batch`` is provided, if ``batch_size`` is not
+            positive, or if ``model_fn_batch`` returns the wrong number
+            of answers.
     """
-    if predictions is None and model_fn is None:
-        msg = "Provide either 'predictions' or 'model_fn'"
+    n_inputs = sum(x is not None for x in (predictions, model_fn, model_fn_batch))
+    if n_inputs == 0:
+        msg = "Provide either 'predictions', 'model_fn' or 'model_fn_batch'"
         raise ValueError(msg)
-    if predictions is not None and model_fn is not None:
-        msg = "Provide only one of 'predictions' or 'model_fn'"
+    if n_inputs > 1:
+        msg = "Provide only one of 'predictions', 'model_fn' or 'model_fn_batch'"
+        raise ValueError(msg)
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
         raise ValueError(msg)
 
     match_fn = _get_match_fn(match_mode, numerical_tolerance)
 
-    results: list[QuestionResult] = []
-    for q in questions:
-        predicted = _get_prediction(q, predictions, model_fn)
-        correct = match_fn(predicted, q.qa.answer)
-        results.append(
-            QuestionResult(
-                question_id=q.id,
-                subtask=q.subtask,
-                predicted=predicted,
-                gold=q.qa.answer,
-                correct=correct,
+    # Pull the fields used below out once, collect every prediction, then
+    # score the whole batch in one map() call so the comparison loop
+    # carries no per-question overhead.
+    ids = [q.id for q in questions]
+    golds = [q.qa.answer for q in questions]
+    predicted = _get_predictions(
+        questions, ids, predictions, model_fn, model_fn_batch, batch_size
+    )
+    correct = list(map(match_fn, predicted, golds))
+
+    subtasks = [q.subtask for q in questions]
+
+    # Every field is already typed (validated questions, str predictions,
+    # bool matches), so the results skip Pydantic validation.
+    results = (
+        [
+            QuestionResult.model_construct(
+                question_id=qid,
+                subtask=st,
+                predicted=pred,
+                gold=gold,
+                correct=ok,
             )
-        )
+            for qid, st, pred, gold, ok in zip(
+                ids, subtasks, predicted, golds, correct, strict=True
+            )
+        ]
+        if detailed
+        else []
+    )
 
-    return _aggregate(results)
+    return _aggregate(subtasks, correct, results)
 
 
-def _get_prediction(
-    question: Question,
+def _get_predictions(
+    questions: list[Question],
+    ids: list[str],
     predictions: dict[str, str] | None,
     model_fn: ModelFn | Any | None,
-) -> str:
-    """Get prediction for a single question."""
+    model_fn_batch: ModelBatchFn | Any | None,
+    batch_size: int,
+) -> list[str]:
+    """Get the prediction for every question, in order."""
     if predictions is not None:
-        pred = predictions.get(question.id, "")
-        if not pred:
-            logger.warning(f"No prediction for {question.id}")
-        return pred
-
-    assert model_fn is not None
-    context = question.format_context()
-    return str(model_fn(question.qa.question, context))
+        get = predictions.get
+        preds = [get(qid, "") for qid in ids]
+        for qid, pred in zip(ids, preds, strict=True):
+            if not pred:
+                logger.warning(f"No prediction for {qid}")
+        return preds
+
+    if model_fn is not None:
+        return [str(model_fn(q.qa.question, q.format_context())) for q in questions]
+
+    assert model_fn_batch is not None
+    preds = []
+    for start in range(0, len(questions), batch_size):
+        batch = questions[start : start + batch_size]
+        answers = model_fn_batch(
+            [q.qa.question for q in batch], [q.format_context() for q in batch]
+        )
+        if len(answers) != len(batch):
+            msg = (
+                f"model_fn_batch returned {len(answers)} answers "
+                f"for {len(batch)} questions"
+            )
+            raise ValueError(msg)
+        preds.extend(map(str, answers))
+    return preds
 
 
 def _get_match_fn(
@@ -123,36 +193,45 @@ def _get_match_fn(
     if mode == "exact":
         return exact_match
     if mode == "numerical":
-
-        def _match(pred: str, gold: str) -> bool:
-            return numerical_match(pred, gold, rel_tolerance=tolerance)
-
-        return _match
+        # Memoized per evaluate() call: categorical and empty answers
+        # repeat the same (pred, gold) pair across many questions.
+        return functools.lru_cache(maxsize=None)(
+            functools.partial(numerical_match, rel_tolerance=tolerance)
+        )
 
     msg = f"Unknown match_mode: {mode!r}. Use 'exact' or 'numerical'."
     raise ValueError(msg)
 
 
-def _aggregate(results: list[QuestionResult]) -> BenchmarkResult:
-    """Aggregate per-question results into a BenchmarkResult."""
-    total = len(results)
-    correct = sum(1 for r in results if r.correct)
-
-    by_subtask: dict[str, list[QuestionResult]] = defaultdict(list)
-    for r in results:
-        by_subtask[r.subtask.value].append(r)
+def _aggregate(
+    subtasks: list[Subtask],
+    correct_flags: list[bool],
+    results: list[QuestionResult],
+) -> BenchmarkResult:
+    """Aggregate per-question outcomes into a BenchmarkResult.
 
-    subtask_results: dict[str, SubtaskResult] = {}
-    for name, sub_results in sorted(by_subtask.items()):
-        sub_total = len(sub_results)
-        sub_correct = sum(1 for r in sub_results if r.correct)
-        subtask_results[name] = SubtaskResult(
-            accuracy=sub_correct / sub_total if sub_total > 0 else 0.0,
+    Metrics come from the parallel ``subtasks``/``correct_flags`` lists,
+    so they are the same whether or not ``results`` was kept.
+    """
+    # Counter consumes the iterables in C, so neither tally runs a
+    # Python-level loop per question.
+    totals = Counter(subtasks)
+    corrects = Counter(itertools.compress(subtasks, correct_flags))
+
+    total = len(subtasks)
+    correct = sum(corrects.values())
+
+    # All values are computed here, so the models skip validation.
+    subtask_results = {
+        st.value: SubtaskResult.model_construct(
+            accuracy=corrects[st] / sub_total,
             total=sub_total,
-            correct=sub_correct,
+            correct=corrects[st],
         )
+        for st, sub_total in sorted(totals.items(), key=lambda kv: kv[0].value)
+    }
 
-    return BenchmarkResult(
+    return BenchmarkResult.model_construct(
         accuracy=correct / total if total > 0 else 0.0,
         total=total,
         correct=correct,
@@ -7,11 +7,19 @@ cross-benchmark comparability.
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+from jfinqa._metrics import wilson_interval
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from typing_extensions import Self
+
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
@@ -84,10 +92,14 @@ class Table(BaseModel):
         """
         if not self.headers:
             return ""
-        header_line = "| " + " | ".join(self.headers) + " |"
-        sep_line = "| " + " | ".join("---" for _ in self.headers) + " |"
-        row_lines = ["| " + " | ".join(row) + " |" for row in self.rows]
-        return "\n".join([header_line, sep_line, *row_lines])
+        # Join the cell runs once with the line break and the outer pipes
+        # as separator, instead of wrapping every row in its own strings.
+        lines = [
+            " | ".join(self.headers),
+            " | ".join(["---"] * len(self.headers)),
+            *[" | ".join(row) for row in self.rows],
+        ]
+        return "| " + " |\n| ".join(lines) + " |"
 
     @property
     def num_rows(self) -> int:
@@ -175,8 +187,13 @@ class Question(BaseModel):
         """Format the full context for LLM input.
 
         Combines pre_text, table (as Markdown), and post_text into
-        a single string suitable for prompting.
+        a single string suitable for prompting. The result is computed
+        once per instance and reused.
         """
+        return self._context
+
+    @functools.cached_property
+    def _context(self) -> str:
         parts: list[str] = []
         if self.pre_text:
             parts.append("\n".join(self.pre_text))
@@ -186,6 +203,19 @@ class Question(BaseModel):
             parts.append("\n".join(self.post_text))
         return "\n\n".join(parts)
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model, dropping the cached context.
+
+        ``model_copy`` copies the instance ``__dict__``, where the cached
+        context lives, so a copy with ``update`` would otherwise keep
+        the context of the original.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_context", None)
+        return copied
+
     def to_finqa_format(self) -> dict[str, Any]:
         """Export to FinQA-compatible JSON dict.
 
@@ -293,13 +323,28 @@ class BenchmarkResult(BaseModel):
     results: list[QuestionResult]
 
     def summary(self) -> str:
-        """Return a human-readable summary string."""
+        """Return a human-readable summary string.
+
+        Accuracies are followed by their 95% Wilson score interval.
+        """
         lines = [
             "jfinqa Benchmark Results",
             "=" * 40,
-            f"Overall: {self.accuracy:.1%} ({self.correct}/{self.total})",
+            f"Overall: {self.accuracy:.1%} ({self.correct}/{self.total})"
+            + _format_ci(self.correct, self.total),
             "",
         ]
         for name, sub in sorted(self.by_subtask.items()):
-            lines.append(f"  {name}: {sub.accuracy:.1%} ({sub.correct}/{sub.total})")
+            lines.append(
+                f"  {name}: {sub.accuracy:.1%} ({sub.correct}/{sub.total})"
+                + _format_ci(sub.correct, sub.total)
+            )
         return "\n".join(lines)
+
+
+def _format_ci(correct: int, total: int) -> str:
+    """Format the 95% Wilson interval for a summary line."""
+    if not total:
+        return ""
+    lower, upper = wilson_interval(correct, total)
+    return f" [95% CI {lower:.1%}-{upper:.1%}]"
@@ -1,10 +1,14 @@
-"""Tests for jfinqa.dataset — local file loading."""
+"""Tests for jfinqa.dataset — local file and HuggingFace loading."""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+from typing import TYPE_CHECKING, Any
 
-from jfinqa.dataset import load_from_file
+import datasets
+import pytest
+
+from jfinqa.dataset import load_dataset, load_from_file, load_from_parquet
 from jfinqa.models import Subtask
 
 if TYPE_CHECKING:
@@ -16,6 +20,16 @@ class TestLoadFromFile:
         questions = load_from_file(str(sample_questions_file))
         assert len(questions) == 5
 
+    def test_load_jsonl(self, sample_questions_file: Path, tmp_path: Path) -> None:
+        raw = json.loads(sample_questions_file.read_text(encoding="utf-8"))
+        jsonl = tmp_path / "questions.jsonl"
+        jsonl.write_text(
+            "\n".join(json.dumps(d, ensure_ascii=False) for d in raw) + "\n\n",
+            encoding="utf-8",
+        )
+        questions = load_from_file(str(jsonl))
+        assert questions == load_from_file(str(sample_questions_file))
+
     def test_subtask_types(self, sample_questions_file: Path) -> None:
         questions = load_from_file(str(sample_questions_file))
         subtasks = {q.subtask for q in questions}
@@ -51,3 +65,79 @@ class TestLoadFromFile:
         assert finqa["id"] == "nr_001"
         assert isinstance(finqa["table"], list)
         assert len(finqa["table"]) == 5  # 1 header + 4 rows
+
+
+def _flat_row(q: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a fixture question the way the Hub upload does."""
+    return {
+        "id": q["id"],
+        "subtask": q["subtask"],
+        "pre_text": q["pre_text"],
+        "post_text": q["post_text"],
+        "table_headers": q["table"]["headers"],
+        "table_rows": q["table"]["rows"],
+        "question": q["qa"]["question"],
+        "answer": q["qa"]["answer"],
+        "program": q["qa"]["program"],
+        "gold_evidence": q["qa"]["gold_evidence"],
+        "edinet_code": q.get("edinet_code"),
+        "filing_year": q.get("filing_year"),
+        "accounting_standard": q.get("accounting_standard"),
+    }
+
+
+class TestLoadDataset:
+    @pytest.fixture()
+    def fake_hub(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_questions_raw: list[dict[str, Any]],
+    ) -> None:
+        """Serve the fixture questions as per-subtask Hub configs."""
+
+        def fake_load(repo: str, *, name: str, split: str) -> datasets.Dataset:
+            rows = [_flat_row(q) for q in sample_questions_raw if q["subtask"] == name]
+            return datasets.Dataset.from_list(rows)
+
+        monkeypatch.setattr(datasets, "load_dataset", fake_load)
+
+    @pytest.mark.usefixtures("fake_hub")
+    def test_single_subtask(self, sample_questions_file: Path) -> None:
+        questions = load_dataset("numerical_reasoning")
+        expected = [
+            q
+            for q in load_from_file(str(sample_questions_file))
+            if q.subtask == Subtask.NUMERICAL_REASONING
+        ]
+        assert questions == expected
+
+    @pytest.mark.usefixtures("fake_hub")
+    def test_all_subtasks(self, sample_questions_file: Path) -> None:
+        questions = load_dataset()
+        expected = load_from_file(str(sample_questions_file))
+        assert sorted(questions, key=lambda q: q.id) == sorted(
+            expected, key=lambda q: q.id
+        )
+
+    def test_missing_subtask_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fake_load(repo: str, *, name: str, split: str) -> datasets.Dataset:
+            raise ValueError(f"BuilderConfig {name!r} not found")
+
+        monkeypatch.setattr(datasets, "load_dataset", fake_load)
+        with pytest.raises(ValueError, match="not found"):
+            load_dataset()
+
+
+class TestLoadFromParquet:
+    def test_matches_json(
+        self,
+        sample_questions_file: Path,
+        sample_questions_raw: list[dict[str, Any]],
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "test.parquet"
+        datasets.Dataset.from_list(
+            [_flat_row(q) for q in sample_questions_raw]
+        ).to_parquet(str(path))
+        questions = load_from_parquet(str(path))
+        assert questions == load_from_file(str(sample_questions_file))
@@ -32,6 +32,27 @@ class TestEvaluate:
         result = evaluate(sample_questions_list, model_fn=model_fn)
         assert result.accuracy == 1.0
 
+    def test_with_model_fn_batch(self, sample_questions_list: list[Question]) -> None:
+        answers = {q.qa.question: q.qa.answer for q in sample_questions_list}
+        batch_sizes = []
+
+        def model_fn_batch(questions: list[str], contexts: list[str]) -> list[str]:
+            assert len(questions) == len(contexts)
+            batch_sizes.append(len(questions))
+            return [answers[q] for q in questions]
+
+        result = evaluate(
+            sample_questions_list, model_fn_batch=model_fn_batch, batch_size=2
+        )
+        assert result.accuracy == 1.0
+        assert batch_sizes == [2, 2, 1]
+
+    def test_model_fn_batch_length_mismatch(
+        self, sample_questions_list: list[Question]
+    ) -> None:
+        with pytest.raises(ValueError, match="returned 0 answers"):
+            evaluate(sample_questions_list, model_fn_batch=lambda qs, cs: [])
+
     def test_wrong_predictions(self, sample_questions_list: list[Question]) -> None:
         preds = {q.id: "WRONG" for q in sample_questions_list}
         result = evaluate(sample_questions_list, predictions=preds)
@@ -66,6 +87,19 @@ class TestEvaluate:
                 predictions={},
                 model_fn=lambda q, c: "",
             )
+        with pytest.raises(ValueError, match="Provide only one"):
+            evaluate(
+                sample_questions_list,
+                model_fn=lambda q, c: "",
+                model_fn_batch=lambda qs, cs: [],
+            )
+
+    def test_summary_only(self, sample_questions_list: list[Question]) -> None:
+        preds = {q.id: q.qa.answer for q in sample_questions_list[:3]}
+        full = evaluate(sample_questions_list, predictions=preds)
+        brief = evaluate(sample_questions_list, predictions=preds, detailed=False)
+        assert brief.results == []
+        assert brief.model_copy(update={"results": full.results}) == full
 
     def test_summary_output(self, sample_questions_list: list[Question]) -> None:
         preds = {q.id: q.qa.answer for q in sample_questions_list}
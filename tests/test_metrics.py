@@ -5,13 +5,21 @@ from __future__ import annotations
 import pytest
 
 from jfinqa._metrics import (
+    clear_caches,
     exact_match,
     extract_number,
     normalize_answer,
     numerical_match,
+    wilson_interval,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_caches() -> None:
+    """Run every test against cold caches."""
+    clear_caches()
+
+
 class TestNormalizeAnswer:
     def test_strip_whitespace(self) -> None:
         assert normalize_answer("  42.5%  ") == "42.5%"
@@ -67,6 +75,15 @@ class TestExtractNumber:
         assert extract_number("50\u5104") == 5_000_000_000.0
         assert extract_number("1.5\u5146") == 1_500_000_000_000.0
 
+    def test_stacked_unit_suffixes(self) -> None:
+        assert extract_number("1234\u5343\u5186\u767e\u4e07\u5186") == 1234.0
+
+    def test_multiple_kanji_multipliers(self) -> None:
+        # The first multiplier in _KANJI_MULTIPLIERS order wins, matching
+        # the lm-evaluation-harness copy of this logic
+        assert extract_number("1\u51042\u5343\u4e07\u5186") == 12_000.0
+        assert extract_number("3\u51465\u5343\u5104") == 35_000.0
+
     def test_non_numeric(self) -> None:
         assert extract_number("\u5897\u52a0") is None
 
@@ -121,6 +138,36 @@ class TestNumericalMatch:
         assert numerical_match("0", "0") is True
         assert numerical_match("1", "0") is False
 
+    def test_plain_numbers_skip_normalization(self) -> None:
+        assert numerical_match(" 25% ", "25.0") is True
+        assert numerical_match("-0.5", "0.5") is False
+        assert normalize_answer.cache_info().currsize == 0
+
     def test_non_numeric_fallback(self) -> None:
         assert numerical_match("consistent", "consistent") is True
         assert numerical_match("consistent", "inconsistent") is False
+
+    def test_categorical_normalized_equal(self) -> None:
+        assert numerical_match("\u6539\u5584\u3057\u305f", "\u6539\u5584") is True
+        assert numerical_match("\u306f\u3044", "\u3044\u3044\u3048") is False
+
+
+class TestWilsonInterval:
+    def test_known_values(self) -> None:
+        lower, upper = wilson_interval(3, 4)
+        assert lower == pytest.approx(0.3006, abs=1e-4)
+        assert upper == pytest.approx(0.9544, abs=1e-4)
+
+    def test_bounds_clamped(self) -> None:
+        assert wilson_interval(0, 5)[0] == 0.0
+        assert wilson_interval(5, 5)[1] == 1.0
+
+
+class TestCaches:
+    def test_clear_caches(self) -> None:
+        normalize_answer("42.5%")
+        extract_number("42.5%")
+        assert normalize_answer.cache_info().currsize > 0
+        clear_caches()
+        assert normalize_answer.cache_info().currsize == 0
+        assert extract_number("42.5%") == 42.5
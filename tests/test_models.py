@@ -74,6 +74,17 @@ class TestQuestion:
         assert "| Revenue |" in ctx
         assert "Revenue increased" in ctx
 
+    def test_format_context_cached(self, sample_question: Question) -> None:
+        ctx = sample_question.format_context()
+        assert sample_question.format_context() is ctx
+        assert sample_question == sample_question.model_copy()
+        assert "_context" not in sample_question.model_dump()
+
+    def test_model_copy_refreshes_context(self, sample_question: Question) -> None:
+        sample_question.format_context()
+        updated = sample_question.model_copy(update={"pre_text": ["Updated."]})
+        assert updated.format_context().startswith("Updated.")
+
     def test_finqa_roundtrip(self, sample_question: Question) -> None:
         finqa = sample_question.to_finqa_format()
         assert finqa["id"] == "nr_001"
@@ -120,3 +131,4 @@ class TestResults:
         summary = result.summary()
         assert "75.0%" in summary
         assert "numerical_reasoning" in summary
+        assert "(3/4) [95% CI 30.1%-95.4%]" in summary